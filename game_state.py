@@ -1,39 +1,105 @@
 """
 Game state machine and core game logic
 """
+import os
 import random
 from settings import GameState
 
+# Per-turn debug output, enabled with GAME_DEBUG=1
+_DEBUG = os.getenv('GAME_DEBUG', '0') == '1'
+
+# Score for a surviving AI with no recorded stats, below any real pop * qol
+_NO_SCORE = float('-inf')
+
+
+class Stats:
+    """
+    Colony stats with a fixed slot layout
+
+    Treated as immutable: updates bind a new Stats instead of changing one,
+    so old/new snapshots can share instances without copying.
+    """
+
+    __slots__ = ('pop', 'qol')
+
+    def __init__(self, pop, qol):
+        self.pop = pop
+        self.qol = qol
+
+    def __repr__(self):
+        return f"Stats(pop={self.pop}, qol={self.qol})"
+
+
+def check_random_state(random_state):
+    """
+    Turn a random_state argument into a random.Random instance
+
+    Args:
+        random_state: None (fresh unseeded generator), an int seed,
+            or an existing random.Random instance (used as is)
+    """
+    if isinstance(random_state, random.Random):
+        return random_state
+    return random.Random(random_state)
+
 
 class Game:
     """Main game class managing state and stats"""
 
-    def __init__(self, game_data):
+    __slots__ = (
+        'game_data', 'config', 'events',
+        '_start_pop', '_start_qol', '_n_events', '_game_over_image',
+        '_opt_chance', '_opt_pop', '_opt_qol', '_opt_success_msg', '_opt_fail_msg', '_opt_fail_image',
+        '_np_options',
+        'current_state', 'current_event_index', 'current_phase', 'gameplay_mode',
+        'stats', 'old_stats', 'ai_stats', 'ai_final_stats',
+        'selected_option', 'outcome_data', 'simultaneous_data',
+        'ai_decisions', '_ai_decision_by_event', 'ai_game_over', 'player_game_over',
+        'ai_elimination_image', 'player_elimination_image',
+        '_rng', 'game_seed', '_success',
+    )
+
+    def __init__(self, game_data, random_state=None):
         """
         Initialize game with data from JSON
 
         Args:
             game_data: Dictionary loaded from gamedata.json
+            random_state: None, an int seed or a random.Random used for the
+                game's own RNG, so callers can inject a deterministic stream
+                without touching the global random module
         """
         self.game_data = game_data
         self.config = game_data['config']
         self.events = game_data['events']
 
+        # Values fixed for the lifetime of the game data
+        self._start_pop = self.config['starting_pop']
+        self._start_qol = self.config['starting_qol']
+        self._n_events = len(self.events)
+        self._game_over_image = self.config.get('game_over_image')
+
+        # Per-option data flattened once at load, indexed [event_index][option_index],
+        # so outcome resolution avoids walking the nested event dicts every turn
+        self._opt_chance = [[o['chance_success'] for o in e['options']] for e in self.events]
+        self._opt_pop = [[o['success_reward']['pop'] for o in e['options']] for e in self.events]
+        self._opt_qol = [[o['success_reward']['qol'] for o in e['options']] for e in self.events]
+        self._opt_success_msg = [[o['success_msg'] for o in e['options']] for e in self.events]
+        self._opt_fail_msg = [[o['fail_msg'] for o in e['options']] for e in self.events]
+        self._opt_fail_image = [[o.get('fail_image', self._game_over_image) for o in e['options']] for e in self.events]
+
+        # NumPy copies of the option tables, built on first use by simulate_ai
+        self._np_options = None
+
         # Game state
         self.current_state = GameState.START_SCREEN
         self.current_event_index = 0
 
         # Player stats
-        self.stats = {
-            'pop': self.config['starting_pop'],
-            'qol': self.config['starting_qol']
-        }
+        self.stats = self._fresh_stats()
         
         # AI stats (for simultaneous mode)
-        self.ai_stats = {
-            'pop': self.config['starting_pop'],
-            'qol': self.config['starting_qol']
-        }
+        self.ai_stats = self._fresh_stats()
 
         # Temporary data for state transitions
         self.selected_option = None
@@ -55,28 +121,29 @@ class Game:
 
         # AI playthrough data
         self.ai_decisions = []  # List of {event_index, option_index, success, stats_before, stats_after}
-        self.ai_final_stats = None  # {'pop': X, 'qol': Y} or None if AI failed
+        self._ai_decision_by_event = {}  # event_index -> entry of ai_decisions (one per event)
+        self.ai_final_stats = None  # Stats or None if AI failed
         self.ai_game_over = False
         self.player_game_over = False
         
         self.ai_elimination_image = None
         self.player_elimination_image = None
 
-        # RNG seed management
+        # RNG seed management (private generator, never the global random module)
+        self._rng = check_random_state(random_state)
         self.game_seed = None
+        self._success = {}  # (event_index, option_index) -> success, filled by initialize_seed
+
+    def _fresh_stats(self):
+        """Return new Stats at the configured starting values"""
+        return Stats(self._start_pop, self._start_qol)
 
     def reset(self):
         """Reset game to initial state"""
         self.current_state = GameState.START_SCREEN
         self.current_event_index = 0
-        self.stats = {
-            'pop': self.config['starting_pop'],
-            'qol': self.config['starting_qol']
-        }
-        self.ai_stats = {
-            'pop': self.config['starting_pop'],
-            'qol': self.config['starting_qol']
-        }
+        self.stats = self._fresh_stats()
+        self.ai_stats = self._fresh_stats()
         self.selected_option = None
         self.outcome_data = None
         self.old_stats = None
@@ -93,16 +160,18 @@ class Game:
         self.gameplay_mode = None
         self.current_phase = None
         self.ai_decisions = []
+        self._ai_decision_by_event = {}
         self.ai_final_stats = None
         self.ai_game_over = False
         self.player_game_over = False
         self.ai_elimination_image = None
         self.player_elimination_image = None
         self.game_seed = None
+        self._success = {}
 
     def get_current_event(self):
         """Get the current event data"""
-        if self.current_event_index < len(self.events):
+        if self.current_event_index < self._n_events:
             return self.events[self.current_event_index]
         return None
 
@@ -124,98 +193,99 @@ class Game:
         option = event['options'][option_index]
         self.selected_option = option
 
-        # Save stats before modification
-        self.old_stats = self.stats.copy()
-
-        # Process outcome with RNG
-        self.process_outcome(option)
+        # Process outcome with RNG (also snapshots old_stats)
+        self.process_outcome(option_index)
 
-    def get_deterministic_outcome(self, event_index, option_index, chance_success):
+    def get_deterministic_outcome(self, event_index, option_index):
         """
         Get a deterministic success/fail result based on seed, event, and option.
         Ensures that if AI and Player pick the same option for the same event, 
         they get the same result.
         """
-        # Create a unique seed for this specific choice point
-        unique_seed = f"{self.game_seed}-{event_index}-{option_index}"
-        
-        # Use a localized Random instance to avoid affecting global RNG state
-        rng = random.Random(unique_seed)
-        roll = rng.random()
-        
-        return roll <= chance_success
+        if not self._success:
+            # The sequential AI/player flow can reach here before a session seed exists
+            self.initialize_seed()
+
+        return self._success[(event_index, option_index)]
+
+    def _resolve(self, stats, event_index, option_index, perish_msg):
+        """
+        Resolve one decision against a set of stats
+
+        Shared by the standard and simultaneous flows. Rewards apply only on
+        success, and a success that drops population to zero or below becomes
+        a failure with perish_msg appended.
 
-    def process_outcome(self, option_data):
+        Returns:
+            dict: Outcome with success, option_index, message, old_stats,
+            new_stats and result_image
+        """
+        if not self.get_deterministic_outcome(event_index, option_index):
+            # Failure leaves the stats untouched
+            return {
+                'success': False,
+                'option_index': option_index,
+                'message': self._opt_fail_msg[event_index][option_index],
+                'old_stats': stats,
+                'new_stats': stats,
+                'result_image': self._opt_fail_image[event_index][option_index]
+            }
+
+        new_stats = Stats(stats.pop + self._opt_pop[event_index][option_index],
+                          stats.qol + self._opt_qol[event_index][option_index])
+        message = self._opt_success_msg[event_index][option_index]
+
+        if new_stats.pop <= 0:
+            # Population collapse is always a failure, whatever the roll
+            return {
+                'success': False,
+                'option_index': option_index,
+                'message': f"{message}\n\n{perish_msg}",
+                'old_stats': stats,
+                'new_stats': new_stats,
+                'result_image': self._game_over_image
+            }
+
+        return {
+            'success': True,
+            'option_index': option_index,
+            'message': message,
+            'old_stats': stats,
+            'new_stats': new_stats,
+            'result_image': None # Success doesn't have a specific image in spec, but could.
+        }
+
+    def process_outcome(self, option_index):
         """
         Roll RNG and determine success or failure
 
         Args:
-            option_data: The selected option dictionary
+            option_index: Index of the selected option in the current event
         """
-        # For standard mode, we need the option index.
-        # But we only have option_data here. 
-        # We need to find the index of this option in the current event.
-        event = self.get_current_event()
-        option_index = 0
-        if event:
-             for i, opt in enumerate(event['options']):
-                 if opt == option_data:
-                     option_index = i
-                     break
-
-        success = self.get_deterministic_outcome(self.current_event_index, option_index, option_data['chance_success'])
-
-        if success:
-            # SUCCESS PATH
-            # Apply rewards
-            self.stats['pop'] += option_data['success_reward']['pop']
-            self.stats['qol'] += option_data['success_reward']['qol']
-
-            # Check for population collapse immediately after stat update
-            if self.stats['pop'] <= 0:
-                self.outcome_data = {
-                    'success': False,
-                    'message': f"{option_data['success_msg']}\n\nThe colony has perished! Population reached zero. All are dead.",
-                    'result_image': self.config.get('game_over_image')
-                }
-                if self.current_phase == 'player':
-                    self.player_game_over = True
-                self.current_state = GameState.GAME_OVER
-                return # Exit early, it's game over
-            
-            # Store outcome for display
-            self.outcome_data = {
-                'success': True,
-                'message': option_data['success_msg'],
-                'old_stats': self.old_stats,
-                'new_stats': self.stats.copy(),
-                'result_image': None # Success doesn't have a specific image in spec, but could.
-            }
+        # Save stats before modification (Stats are replaced, never mutated)
+        self.old_stats = self.stats
+
+        self.outcome_data = self._resolve(
+            self.stats, self.current_event_index, option_index,
+            "The colony has perished! Population reached zero. All are dead."
+        )
+        self.stats = self.outcome_data['new_stats']
 
+        if self.outcome_data['success']:
             # Transition to result display
             self.current_state = GameState.RESULT_DISPLAY
         else:
-            # FAIL PATH
-            # Store outcome for display
-            fail_image = option_data.get('fail_image', self.config.get('game_over_image'))
-            
-            self.outcome_data = {
-                'success': False,
-                'message': option_data['fail_msg'],
-                'result_image': fail_image
-            }
-
-            # Immediate game over, no stat update
+            # Failure or population collapse is an immediate game over
             if self.current_phase == 'player':
                 self.player_game_over = True
-            
+
             self.current_state = GameState.GAME_OVER
 
     def advance_to_next_event(self):
         """Move to next event or victory screen"""
         self.current_event_index += 1
 
-        if self.current_event_index >= len(self.events):
+        if self.current_event_index >= self._n_events:
             # No more events, player wins
             self.current_state = GameState.VICTORY
         else:
@@ -228,23 +298,25 @@ class Game:
 
     def initialize_seed(self):
         """Generate and store a fixed seed for this game session"""
-        self.game_seed = random.randint(0, 999999)
-        random.seed(self.game_seed)
-
-    def reset_seed_for_player(self):
-        """Reset RNG to same seed for player phase"""
-        random.seed(self.game_seed)
+        self.game_seed = self._rng.randint(0, 999999)
+
+        # Resolve every (event, option) choice point once up front, so a
+        # decision is a single lookup and AI and player share the same outcomes
+        rng = random.Random(self.game_seed)
+        self._success = {
+            (event_index, option_index): rng.random() <= chance
+            for event_index, chances in enumerate(self._opt_chance)
+            for option_index, chance in enumerate(chances)
+        }
 
     def start_ai_phase(self):
         """Begin AI playthrough"""
         self.current_phase = 'ai'
         self.current_state = GameState.AI_EVENT_DISPLAY
         self.current_event_index = 0
-        self.stats = {
-            'pop': self.config['starting_pop'],
-            'qol': self.config['starting_qol']
-        }
+        self.stats = self._fresh_stats()
         self.ai_decisions = []
+        self._ai_decision_by_event = {}
         self.ai_game_over = False
 
     def record_ai_decision(self, option_index, success, reason=""):
@@ -254,18 +326,19 @@ class Game:
             'option_index': option_index,
             'reason': reason,
             'success': success,
-            'stats_before': self.old_stats.copy(),
-            'stats_after': self.stats.copy() if success else None
+            'stats_before': self.old_stats,
+            'stats_after': self.stats if success else None
         })
+        self._ai_decision_by_event[self.current_event_index] = self.ai_decisions[-1]
 
     def ai_advance_to_next_event(self):
         """AI phase progression"""
         self.current_event_index += 1
         self.selected_option = None  # Reset selection for next event
 
-        if self.current_event_index >= len(self.events):
+        if self.current_event_index >= self._n_events:
             # AI completed all events successfully
-            self.ai_final_stats = self.stats.copy()
+            self.ai_final_stats = self.stats
             self.current_state = GameState.VICTORY
         else:
             # Continue to next event
@@ -286,27 +359,17 @@ class Game:
         self.player_game_over = False
 
         # Reset stats
-        self.stats = {
-            'pop': self.config['starting_pop'],
-            'qol': self.config['starting_qol']
-        }
-
-        # Reset seed for fair comparison
-        self.reset_seed_for_player()
+        self.stats = self._fresh_stats()
 
     def get_ai_choice_for_current_event(self):
         """Get what AI chose for current event (if it got there)"""
-        for decision in self.ai_decisions:
-            if decision['event_index'] == self.current_event_index:
-                return decision['option_index']
-        return None
+        decision = self._ai_decision_by_event.get(self.current_event_index)
+        return decision['option_index'] if decision else None
 
     def get_ai_reason_for_current_event(self):
         """Get AI's reasoning for current event"""
-        for decision in self.ai_decisions:
-            if decision['event_index'] == self.current_event_index:
-                return decision.get('reason', "")
-        return None
+        decision = self._ai_decision_by_event.get(self.current_event_index)
+        return decision.get('reason', "") if decision else None
 
     def player_select_option(self, option_index):
         """Player makes a choice (possibly overriding AI)"""
@@ -316,21 +379,92 @@ class Game:
 
         option = event['options'][option_index]
         self.selected_option = option
-        self.old_stats = self.stats.copy()
 
         # Process with same RNG sequence as AI used
-        self.process_outcome(option)
+        self.process_outcome(option_index)
 
     def player_advance_to_next_event(self):
         """Player phase progression"""
         self.current_event_index += 1
 
-        if self.current_event_index >= len(self.events):
+        if self.current_event_index >= self._n_events:
             # Player completed all events
             self.current_state = GameState.COMPARISON
         else:
             self.current_state = GameState.PLAYER_EVENT_DISPLAY
 
+    def _option_arrays(self):
+        """Return (chance, pop, qol) arrays of shape (n_events, max_options)"""
+        if self._np_options is None:
+            # Only batch simulation needs numpy, so the game itself doesn't
+            import numpy as np
+
+            n_events = self._n_events
+            width = max((len(row) for row in self._opt_chance), default=0)
+            chance = np.zeros((n_events, width))
+            pop = np.zeros((n_events, width), dtype=np.int64)
+            qol = np.zeros((n_events, width), dtype=np.int64)
+            # Events with fewer options are padded with a zero chance of success
+            for i in range(n_events):
+                n_opts = len(self._opt_chance[i])
+                chance[i, :n_opts] = self._opt_chance[i]
+                pop[i, :n_opts] = self._opt_pop[i]
+                qol[i, :n_opts] = self._opt_qol[i]
+            self._np_options = (chance, pop, qol)
+        return self._np_options
+
+    def simulate_ai(self, option_indices, seed):
+        """
+        Simulate a whole playthrough for a fixed list of choices in one vectorized pass.
+
+        Meant for batch evaluation (e.g. Monte Carlo balance sweeps over many seeds);
+        the interactive game keeps resolving events one at a time. Rolls come from
+        np.random.default_rng(seed), so they do not match the game's own rolls
+        (random.Random(game_seed) in initialize_seed) even for the same seed.
+
+        Args:
+            option_indices: Sequence with one valid integer option index per
+                event; anything else raises ValueError
+            seed: Seed for this playthrough's rolls
+
+        Returns:
+            dict: {'completed': bool, 'failed_at': int or None, 'stats': Stats or None}
+        """
+        import numpy as np
+
+        chance, pop, qol = self._option_arrays()
+        n_events = self._n_events
+        idx = np.arange(n_events)
+        option_indices = np.asarray(option_indices)
+        # Casting would silently truncate floats (1.9 -> 1)
+        if not np.issubdtype(option_indices.dtype, np.integer):
+            raise ValueError(f"Option indices must be integers, got {option_indices.dtype}")
+        if option_indices.shape != (n_events,):
+            raise ValueError(f"Expected option indices of shape ({n_events},), got {option_indices.shape}")
+        option_indices = option_indices.astype(np.intp)
+        # Negative indices would wrap around in the lookups below, and ones past
+        # an event's own options would read its zero-chance padding
+        n_options = np.array([len(row) for row in self._opt_chance], dtype=np.intp)
+        bad = (option_indices < 0) | (option_indices >= n_options)
+        if bad.any():
+            event_index = int(np.argmax(bad))
+            raise ValueError(f"Option index {int(option_indices[event_index])} is out of range for "
+                             f"event {event_index} ({int(n_options[event_index])} options)")
+
+        rolls = np.random.default_rng(seed).random(n_events)
+        pops = pop[idx, option_indices]
+        qols = qol[idx, option_indices]
+
+        # An event is survived if the roll succeeds and population stays above zero.
+        # The running sum is only meaningful up to the first failure, which is all we read.
+        alive = (rolls <= chance[idx, option_indices]) & (self._start_pop + np.cumsum(pops) > 0)
+
+        if not alive.all():
+            return {'completed': False, 'failed_at': int(np.argmax(~alive)), 'stats': None}
+
+        final_stats = Stats(self._start_pop + int(pops.sum()), self._start_qol + int(qols.sum()))
+        return {'completed': True, 'failed_at': None, 'stats': final_stats}
+
     def calculate_comparison_data(self):
         """Prepare data for comparison screen"""
         return {
@@ -340,38 +474,32 @@ class Game:
             },
             'player': {
                 'completed': not self.player_game_over,
-                'stats': self.stats.copy(),
+                'stats': self.stats,
             },
             'winner': self.determine_winner()
         }
 
     def determine_winner(self):
         """Determine winner based on survival and total score"""
-        # 1. Survival Check
-        # If Player died and AI survived -> AI Wins
-        if self.player_game_over and not self.ai_game_over:
-            return 'ai'
-        
-        # If Player survived and AI died -> Player Wins
-        if not self.player_game_over and self.ai_game_over:
-            return 'player'
-            
-        # If both died -> Tie
-        if self.player_game_over and self.ai_game_over:
-            return 'tie'
+        # Scores are (survived, pop * qol), so survival always beats any score
+        # and two eliminated colonies tie. Missing AI stats score below any real
+        # total, which keeps the old "player wins" fallback.
+        ai_stats = self.ai_final_stats
+        if self.ai_game_over:
+            ai_score = (False, 0)
+        elif ai_stats:
+            ai_score = (True, ai_stats.pop * ai_stats.qol)
+        else:
+            ai_score = (True, _NO_SCORE)
 
-        # 2. Score Check (Both Survived)
-        # Ensure stats are available (should be if no game over)
-        if not self.ai_final_stats:
-             # Fallback if something went wrong, though shouldn't happen here
-             return 'player' 
-             
-        ai_total = self.ai_final_stats['pop'] * self.ai_final_stats['qol']
-        player_total = self.stats['pop'] * self.stats['qol']
+        if self.player_game_over:
+            player_score = (False, 0)
+        else:
+            player_score = (True, self.stats.pop * self.stats.qol)
 
-        if player_total > ai_total:
+        if player_score > ai_score:
             return 'player'
-        elif ai_total > player_total:
+        elif ai_score > player_score:
             return 'ai'
         else:
             return 'tie'
@@ -383,14 +511,8 @@ class Game:
         self.current_event_index = 0
         
         # Reset stats for both
-        self.stats = {
-            'pop': self.config['starting_pop'],
-            'qol': self.config['starting_qol']
-        }
-        self.ai_stats = {
-            'pop': self.config['starting_pop'],
-            'qol': self.config['starting_qol']
-        }
+        self.stats = self._fresh_stats()
+        self.ai_stats = self._fresh_stats()
         
         # Reset tracking
         self.simultaneous_data = {
@@ -404,6 +526,7 @@ class Game:
         self.player_game_over = False
         
         self.ai_decisions = []
+        self._ai_decision_by_event = {}
         self.ai_final_stats = None
         self.ai_elimination_image = None
         self.player_elimination_image = None
@@ -416,53 +539,50 @@ class Game:
         if not event: 
             return
             
-        print(f"DEBUG: Processing AI Decision. Event: {event['title']}, Option: {option_index}")
+        if _DEBUG:
+            print(f"DEBUG: Processing AI Decision. Event: {event['title']}, Option: {option_index}")
 
         self.simultaneous_data['ai_choice'] = option_index
         self.simultaneous_data['ai_reason'] = reason
         
         # Process outcome for AI
-        option = event['options'][option_index]
-        
-        # Use deterministic RNG
-        success = self.get_deterministic_outcome(self.current_event_index, option_index, option['chance_success'])
-        
-        print(f"DEBUG: Outcome - Success: {success} (Chance: {option['chance_success']})")
-        
-        outcome = {
-            'success': success,
-            'option_index': option_index,
-            'old_stats': self.ai_stats.copy()
-        }
-        
-        if success:
-            self.ai_stats['pop'] += option['success_reward']['pop']
-            self.ai_stats['qol'] += option['success_reward']['qol']
-            outcome['message'] = option['success_msg']
-            outcome['result_image'] = None
-        else:
-            outcome['message'] = option['fail_msg']
-            outcome['result_image'] = option.get('fail_image', self.config.get('game_over_image'))
-            self.ai_game_over = True # Eliminated on RNG failure
-            self.ai_elimination_image = outcome['result_image']
-            print("DEBUG: AI Eliminated due to RNG Failure")
-            
-        # Check for population failure
-        print(f"DEBUG: AI Stats: {self.ai_stats}")
-        if self.ai_stats['pop'] <= 0:
+        outcome = self._resolve(
+            self.ai_stats, self.current_event_index, option_index,
+            "The AI colony has perished! Population reached zero."
+        )
+        self.ai_stats = outcome['new_stats']
+
+        if _DEBUG:
+            print(f"DEBUG: Outcome - Success: {outcome['success']} (Chance: {self._opt_chance[self.current_event_index][option_index]})")
+
+        if not outcome['success']:
+            # Eliminated on RNG failure or population collapse
             self.ai_game_over = True
-            self.ai_elimination_image = self.config.get('game_over_image')
-            print("DEBUG: AI Eliminated due to Low Population")
-            # If population collapse, it's always a failure state for the outcome
-            outcome['success'] = False 
-            # Append death message to existing message (which is either success_msg or fail_msg)
-            outcome['message'] = f"{outcome['message']}\n\nThe AI colony has perished! Population reached zero."
-            outcome['result_image'] = self.config.get('game_over_image')
+            self.ai_elimination_image = outcome['result_image']
+            if _DEBUG:
+                print("DEBUG: AI Eliminated")
 
-            
-        outcome['new_stats'] = self.ai_stats.copy()
+        if _DEBUG:
+            print(f"DEBUG: AI Stats: {self.ai_stats}")
         self.simultaneous_data['ai_outcome'] = outcome
 
+    def next_ai_turn(self):
+        """
+        Get the AI's next simultaneous decision point
+
+        The AI's stats for the next event are final as soon as its current
+        outcome is resolved, so the next LLM call can start before the player
+        has chosen.
+
+        Returns:
+            tuple: (event_index, stats) for the next event, or None if the AI
+            is eliminated or this is the last event
+        """
+        next_index = self.current_event_index + 1
+        if self.ai_game_over or next_index >= self._n_events:
+            return None
+        return next_index, self.ai_stats
+
     def process_simultaneous_player_decision(self, option_index):
         """Process Player decision in simultaneous mode"""
         event = self.get_current_event()
@@ -472,39 +592,17 @@ class Game:
         self.simultaneous_data['player_choice'] = option_index
         
         # Process outcome for Player
-        option = event['options'][option_index]
-        
-        # Use deterministic RNG
-        success = self.get_deterministic_outcome(self.current_event_index, option_index, option['chance_success'])
-        
-        outcome = {
-            'success': success,
-            'option_index': option_index,
-            'old_stats': self.stats.copy()
-        }
-        
-        if success:
-            self.stats['pop'] += option['success_reward']['pop']
-            self.stats['qol'] += option['success_reward']['qol']
-            outcome['message'] = option['success_msg']
-            outcome['result_image'] = None
-        else:
-            outcome['message'] = option['fail_msg']
-            outcome['result_image'] = option.get('fail_image', self.config.get('game_over_image'))
-            self.player_game_over = True # Eliminated on RNG failure
-            self.player_elimination_image = outcome['result_image']
-            
-        # Check for population failure
-        if self.stats['pop'] <= 0:
+        outcome = self._resolve(
+            self.stats, self.current_event_index, option_index,
+            "Your colony has perished! Population reached zero."
+        )
+        self.stats = outcome['new_stats']
+
+        if not outcome['success']:
+            # Eliminated on RNG failure or population collapse
             self.player_game_over = True
-            self.player_elimination_image = self.config.get('game_over_image')
-            # If population collapse, it's always a failure state for the outcome
-            outcome['success'] = False 
-            # Append death message to existing message
-            outcome['message'] = f"{outcome['message']}\n\nYour colony has perished! Population reached zero."
-            outcome['result_image'] = self.config.get('game_over_image')
-            
-        outcome['new_stats'] = self.stats.copy()
+            self.player_elimination_image = outcome['result_image']
+
         self.simultaneous_data['player_outcome'] = outcome
         
         # Both have decided, move to Result Display
@@ -517,8 +615,8 @@ class Game:
         outcome = {
             'success': False,
             'option_index': -1,
-            'old_stats': self.stats.copy(),
-            'new_stats': self.stats.copy(),
+            'old_stats': self.stats,
+            'new_stats': self.stats,
             'message': "ELIMINATED"
         }
         self.simultaneous_data['player_outcome'] = outcome
@@ -540,11 +638,11 @@ class Game:
         # Check if BOTH players are eliminated
         if self.ai_game_over and self.player_game_over:
              # Skip remaining events
-             self.ai_final_stats = self.ai_stats.copy()
+             self.ai_final_stats = self.ai_stats
              self.current_state = GameState.COMPARISON
              return
 
-        if self.current_event_index >= len(self.events):
+        if self.current_event_index >= self._n_events:
             # Game Over / Comparison
             # In simultaneous mode, we just show comparison at end
             # But we need to handle "Death" during game?
@@ -556,7 +654,7 @@ class Game:
             # Let's check death conditions here?
             # Actually, standard game over handles immediate transition.
             # For now, let's just go to Comparison if events done.
-            self.ai_final_stats = self.ai_stats.copy()
+            self.ai_final_stats = self.ai_stats
             self.current_state = GameState.COMPARISON
         else:
             self.current_state = GameState.SIMULTANEOUS_EVENT_DISPLAY
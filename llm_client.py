@@ -3,94 +3,458 @@ LLM client for AI decision-making
 Supports: Gemini (via official SDK)
 """
 import os
+import asyncio
+import hashlib
 import json
+import logging
 import random
-import google.generativeai as genai
+import re
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+import tenacity
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Dedicated RNG for fallback choices, so they never touch the global random state
+_fallback_rng = random.Random()
+
+# Resolved once at import rather than on every prompt and response
+_SHOW_LLM = os.getenv('SHOW_LLM_INTERACTION', 'false').lower() == 'true'
+
+# First valid 1-based choice digit in a malformed response
+_FIRST_CHOICE_RE = re.compile(r'[1-3]')
+
+# Body of the first markdown code block, with or without a json tag
+_FENCE_RE = re.compile(r'```(?:json)?\s*(.*?)```', re.DOTALL)
+
+_model_lock = threading.Lock()
+
+# JSON mode: the model must answer with exactly this object. The choice stays
+# 1-based like the prompt, and temperature 0 keeps answers repeatable.
+_DECISION_SCHEMA = {
+    'type': 'object',
+    'properties': {
+        'choice': {'type': 'integer', 'description': "Chosen option number: 1, 2, or 3"},
+        'reason': {'type': 'string'},
+    },
+    'required': ['choice', 'reason'],
+}
+_GENERATION_CONFIG = {
+    'response_mime_type': 'application/json',
+    'response_schema': _DECISION_SCHEMA,
+    'temperature': 0.0,
+    'top_p': 1.0,
+}
+
+
+def _rest_schema(schema):
+    """Copy of a schema with the upper-case type names the REST API expects"""
+    out = dict(schema, type=schema['type'].upper())
+    if 'properties' in schema:
+        out['properties'] = {name: _rest_schema(prop) for name, prop in schema['properties'].items()}
+    return out
+
+
+# _GENERATION_CONFIG as written into Batch API request files, so offline
+# answers come back in the same JSON mode as realtime turns
+_BATCH_GENERATION_CONFIG = dict(_GENERATION_CONFIG, response_schema=_rest_schema(_DECISION_SCHEMA))
+
+# Response cache: stats are bucketed so near-identical states share an answer
+_CACHE_SIZE = 128
+_CACHE_POP_BUCKET = 1000
+_CACHE_QOL_BUCKET = 5
+
+# Static start of every prompt, kept identical so the provider's implicit
+# prefix caching can reuse it across calls
+_PROMPT_PREAMBLE = """You are managing a Mars colony. You will be given the colony's current stats, an event and its numbered options.
+
+Return ONLY valid JSON (no markdown, no code fences).
+Format:
+{
+  "choice": 1,
+  "reason": "brief explanation"
+}
+Choice must be 1, 2, or 3.
+"""
+
+# Per-call part of the prompt, filled with str.format_map after the preamble
+_PROMPT_TEMPLATE = """
+Current stats:
+Population: {pop}
+Quality of Life: {qol}
+
+EVENT: {title}
+{description}
+
+OPTIONS:
+{options_text}"""
+
+
+def _is_retryable(error):
+    """Check for transient API errors worth retrying before the fallback"""
+    # Only reached once a call has failed, so the SDK is already loaded
+    from google.api_core import exceptions as google_exceptions
+    return isinstance(error, (
+        google_exceptions.ResourceExhausted,
+        google_exceptions.ServiceUnavailable,
+        google_exceptions.DeadlineExceeded,
+    ))
+
+
+class _RateLimiter:
+    """
+    Token bucket allowing rate calls per period seconds
+
+    Unlike aiolimiter's AsyncLimiter it is not bound to one event loop, so
+    the quota carries over between asyncio.run calls and across threads.
+    """
+
+    def __init__(self, rate, period=60):
+        self._capacity = rate
+        self._tokens = float(rate)
+        self._fill_rate = rate / period
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _take(self):
+        """Take a token if one is free, otherwise return the seconds until one is"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._fill_rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0
+            return (1 - self._tokens) / self._fill_rate
+
+    async def acquire(self):
+        """Wait, without blocking the event loop, until a token is taken"""
+        while (delay := self._take()) > 0:
+            await asyncio.sleep(delay)
+
+
+@lru_cache(maxsize=None)
+def _get_model(model_name, api_key):
+    """
+    Return the process-wide GenerativeModel for this model and key
+
+    Every LLMClient shares one configured SDK and model object, so its
+    transport is built once instead of per client. The SDK is imported
+    here, so code that never builds a model doesn't pay for loading it.
+    """
+    import google.generativeai as genai
+
+    with _model_lock:
+        genai.configure(api_key=api_key)
+        return genai.GenerativeModel(model_name, generation_config=_GENERATION_CONFIG)
+
 
 class LLMClient:
     """AI provider client - currently supports Gemini via SDK"""
 
-    def __init__(self):
+    def __init__(self, request_timeout=60, max_retries=2, qpm=60):
         """
         Initialize LLM client with Gemini provider
+
+        Args:
+            request_timeout: Seconds a single API request may run before it
+                counts as failed
+            max_retries: Retries after a transient API error, with jittered
+                exponential backoff, before using the fallback. Realtime calls
+                also stop retrying once request_timeout has passed in total.
+            qpm: Maximum async requests per minute (token bucket), counted
+                across every batch the client runs, so they stay under the API
+                quota; 60 is safe on the free tier
         """
         self.provider = 'gemini'
+        self.request_timeout = request_timeout
+        self.qpm = qpm
+        # One bucket for the client's lifetime, shared by every batch
+        self._rate_limiter = _RateLimiter(qpm)
+
+        retry_policy = dict(
+            wait=tenacity.wait_random_exponential(multiplier=0.5, max=8),
+            stop=tenacity.stop_after_attempt(max_retries + 1),
+            retry=tenacity.retry_if_exception(_is_retryable),
+            reraise=True,
+        )
+        # A realtime turn keeps the player waiting, so all of its attempts
+        # share one request_timeout budget (see _call_gemini)
+        self._retrying = tenacity.Retrying(**dict(
+            retry_policy,
+            stop=tenacity.stop_after_attempt(max_retries + 1) | tenacity.stop_after_delay(request_timeout),
+        ))
+        self._aretrying = tenacity.AsyncRetrying(**retry_policy)
         self.model = None
         self.api_key = os.getenv('GEMINI_API_KEY')
+
+        # LRU of parsed decisions keyed by _cache_key
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
         
         if self.api_key:
-            # Configure the official SDK
-            genai.configure(api_key=self.api_key)
             # gemini-1.5-flash is faster/cheaper for decision logic than pro
-            self.model = genai.GenerativeModel('gemini-2.5-flash')
+            self.model = _get_model('gemini-2.5-flash', self.api_key)
 
     def is_available(self):
         """Check if API key is configured"""
         return self.api_key is not None and self.api_key != ""
 
+    def _fallback(self):
+        """Random decision used when the LLM can't be reached"""
+        return {'choice': _fallback_rng.randint(0, 2), 'reason': "I made a random choice because my neural link was disrupted."}
+
+    def _cache_key(self, event_data, current_stats):
+        """Hash the event and bucketed stats into a response cache key"""
+        raw = (f"{event_data['title']}|{tuple(o['text'] for o in event_data['options'])}"
+               f"|{current_stats.pop // _CACHE_POP_BUCKET}|{current_stats.qol // _CACHE_QOL_BUCKET}")
+        return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+    def _cache_get(self, key):
+        """Return a copy of the cached decision for key, or None"""
+        with self._cache_lock:
+            hit = self._cache.get(key)
+            if hit is None:
+                return None
+            self._cache.move_to_end(key)
+            return dict(hit)
+
+    def _cache_put(self, key, decision):
+        """Store a decision, evicting the least recently used past _CACHE_SIZE"""
+        with self._cache_lock:
+            self._cache[key] = decision
+            self._cache.move_to_end(key)
+            if len(self._cache) > _CACHE_SIZE:
+                self._cache.popitem(last=False)
+
+    def _call_gemini(self, prompt):
+        """
+        Call the model, retrying transient errors per the client's policy
+
+        Each attempt may only use what is left of request_timeout, so a slow
+        or timed-out turn reaches the fallback after about request_timeout
+        plus one backoff, rather than one full timeout per attempt.
+        """
+        deadline = time.monotonic() + self.request_timeout
+
+        def call():
+            remaining = max(deadline - time.monotonic(), 1)
+            return self.model.generate_content(prompt, request_options={'timeout': remaining})
+
+        return self._retrying(call)
+
+    async def _acall_gemini(self, prompt):
+        """Async _call_gemini; every attempt, retries included, takes a rate-limit token"""
+        async def call():
+            await self._rate_limiter.acquire()
+            return await self.model.generate_content_async(
+                prompt, request_options={'timeout': self.request_timeout}
+            )
+
+        return await self._aretrying(call)
+
     def get_ai_decision(self, event_data, current_stats):
         """
         Ask LLM to choose an option for the given event
 
         Args:
             event_data: Dict with 'title', 'description', 'options'
-            current_stats: Dict with 'pop', 'qol'
+            current_stats: Stats with .pop and .qol
 
         Returns:
             dict: {'choice': int, 'reason': str}
         """
-        fallback = {'choice': random.randint(0, 2), 'reason': "I made a random choice because my neural link was disrupted."}
+        fallback = self._fallback()
         
         if not self.is_available():
-            print(f"DEBUG: LLM Provider '{self.provider}' not available. Returning fallback.")
+            logger.debug("LLM Provider '%s' not available. Returning fallback.", self.provider)
             return fallback
 
+        key = self._cache_key(event_data, current_stats)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
         prompt = self.build_prompt(event_data, current_stats)
-        print(f"DEBUG: Executing AI Decision with provider: '{self.provider}'")
+        logger.debug("Executing AI Decision with provider: '%s'", self.provider)
 
         try:
             # Official SDK call
-            response = self.model.generate_content(prompt)
+            response = self._call_gemini(prompt)
             # The SDK response object has a .text property
-            return self.parse_response_text(response.text)
+            decision, clean = self._parse_decision(response.text)
+            if clean:
+                # Salvaged or random choices are not cached, so one bad reply
+                # doesn't decide this event for the rest of the session
+                self._cache_put(key, decision)
+            return dict(decision)
             
         except Exception as e:
-            print(f"LLM API error: {e}")
+            logger.warning("LLM API error: %s", e)
             return fallback
 
-    def build_prompt(self, event_data, current_stats):
-        """Construct prompt for LLM, focusing on the user query"""
-        options_text = ""
-        for i, opt in enumerate(event_data['options']):
-            details = opt.get('details', 'No details provided.')
-            # Show 1-based index to AI
-            options_text += f"{i + 1}: {opt['text']}\n   Details: {details}\n"
+    async def aget_ai_decision(self, event_data, current_stats):
+        """
+        Async variant of get_ai_decision, using the SDK's async call
+
+        Args:
+            event_data: Dict with 'title', 'description', 'options'
+            current_stats: Stats with .pop and .qol
 
-        prompt_content = f"""You are managing a Mars colony. Current stats:
-Population: {current_stats['pop']}
-Quality of Life: {current_stats['qol']}
+        Returns:
+            dict: {'choice': int, 'reason': str}
+        """
+        if not self.is_available():
+            return self._fallback()
 
-EVENT: {event_data['title']}
-{event_data['description']}
+        key = self._cache_key(event_data, current_stats)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
 
-OPTIONS:
-{options_text}
+        prompt = self.build_prompt(event_data, current_stats)
 
-Return ONLY valid JSON (no markdown, no code fences).
-Format:
-{{
-  "choice": 1,
-  "reason": "brief explanation"
-}}
-Choice must be 1, 2, or 3.
-"""
+        try:
+            response = await self._acall_gemini(prompt)
+            decision, clean = self._parse_decision(response.text)
+            if clean:
+                # Salvaged or random choices are not cached, so one bad reply
+                # doesn't decide this event for the rest of the session
+                self._cache_put(key, decision)
+            return dict(decision)
+
+        except Exception as e:
+            logger.warning("LLM API error: %s", e)
+            return self._fallback()
+
+    async def get_ai_decisions_batch(self, items, concurrency=4):
+        """
+        Get decisions for several (event_data, current_stats) pairs concurrently
+
+        Args:
+            items: Iterable of (event_data, current_stats) tuples
+            concurrency: Maximum number of requests in flight at once
+
+        Returns:
+            list: One {'choice': int, 'reason': str} per item, in order
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def decide(event_data, current_stats):
+            async with semaphore:
+                return await self.aget_ai_decision(event_data, current_stats)
+
+        results = await asyncio.gather(*(decide(e, s) for e, s in items), return_exceptions=True)
+        return [self._fallback() if isinstance(r, BaseException) else r for r in results]
+
+    def get_ai_decisions_batch_sync(self, items, concurrency=4):
+        """Blocking wrapper around get_ai_decisions_batch for non-async callers"""
+        return asyncio.run(self.get_ai_decisions_batch(items, concurrency))
+
+    def submit_batch_decisions(self, items, jsonl_path, poll_interval=30):
+        """
+        Get decisions for many (event_data, current_stats) pairs via the Gemini Batch API
+
+        Meant for offline replays and simulations: batch jobs cost less and
+        have higher limits, but can take up to a day to finish. Realtime turns
+        should keep using get_ai_decision. Needs the google-genai package.
+
+        Args:
+            items: Iterable of (event_data, current_stats) tuples
+            jsonl_path: Where to write the request file before uploading it
+            poll_interval: Seconds between job status checks
+
+        Returns:
+            list: One {'choice': int, 'reason': str} per item, in order
+        """
+        items = list(items)
+        if not self.is_available():
+            return [self._fallback() for _ in items]
+
+        try:
+            from google import genai as genai_batch
+        except ImportError:
+            logger.warning("Batch decisions need the google-genai package.")
+            return [self._fallback() for _ in items]
+
+        with open(jsonl_path, 'w') as f:
+            for i, (event_data, current_stats) in enumerate(items):
+                request = {
+                    "contents": [{"parts": [{"text": self.build_prompt(event_data, current_stats)}]}],
+                    "generation_config": _BATCH_GENERATION_CONFIG,
+                }
+                f.write(json.dumps({"key": f"req_{i}", "request": request}) + "\n")
+
+        try:
+            client = genai_batch.Client(api_key=self.api_key)
+            uploaded = client.files.upload(file=jsonl_path, config={'mime_type': 'jsonl'})
+            job = client.batches.create(model='gemini-2.5-flash', src=uploaded.name)
+
+            done_states = ('JOB_STATE_SUCCEEDED', 'JOB_STATE_FAILED', 'JOB_STATE_CANCELLED', 'JOB_STATE_EXPIRED')
+            while job.state.name not in done_states:
+                time.sleep(poll_interval)
+                job = client.batches.get(name=job.name)
+
+            if job.state.name != 'JOB_STATE_SUCCEEDED':
+                logger.warning("LLM batch job ended with %s", job.state.name)
+                return [self._fallback() for _ in items]
+
+            content = client.files.download(file=job.dest.file_name).decode('utf-8')
+
+        except Exception as e:
+            logger.warning("LLM API error: %s", e)
+            return [self._fallback() for _ in items]
+
+        # Results may come back in any order, so match them up by key
+        texts = {}
+        for line in content.splitlines():
+            if not line.strip():
+                continue
+            try:
+                result = json.loads(line)
+                texts[result['key']] = result['response']['candidates'][0]['content']['parts'][0]['text']
+            except (json.JSONDecodeError, KeyError, IndexError, TypeError) as e:
+                # Entries without a usable answer get the fallback below
+                logger.warning("Skipping unreadable batch result line (%s): %.200s", e, line)
+
+        decisions = []
+        for i, (event_data, current_stats) in enumerate(items):
+            text = texts.get(f"req_{i}")
+            if text is None:
+                decisions.append(self._fallback())
+                continue
+            decision, clean = self._parse_decision(text)
+            if clean:
+                # Same rule as the realtime calls: only real JSON answers are cached
+                self._cache_put(self._cache_key(event_data, current_stats), decision)
+            else:
+                logger.warning("Batch result req_%d was not clean JSON; using a salvaged choice", i)
+            decisions.append(dict(decision))
+        return decisions
+
+    def build_prompt(self, event_data, current_stats):
+        """Construct prompt for LLM, focusing on the user query"""
+        # Show 1-based index to AI
+        options_text = "".join(
+            f"{i + 1}: {opt['text']}\n   Details: {opt.get('details', 'No details provided.')}\n"
+            for i, opt in enumerate(event_data['options'])
+        )
+
+        prompt_content = _PROMPT_PREAMBLE + _PROMPT_TEMPLATE.format_map({
+            'pop': current_stats.pop,
+            'qol': current_stats.qol,
+            'title': event_data['title'],
+            'description': event_data['description'],
+            'options_text': options_text,
+        })
         
-        if os.getenv('SHOW_LLM_INTERACTION', 'false').lower() == 'true':
+        if _SHOW_LLM:
             print("\n--- LLM USER PROMPT ---")
             print(prompt_content)
             print("------------------\n")
@@ -99,45 +463,45 @@ Choice must be 1, 2, or 3.
 
     def parse_response_text(self, text):
         """Extract option and reason from LLM text response"""
-        import json
-        import re
-        
-        if os.getenv('SHOW_LLM_INTERACTION', 'false').lower() == 'true':
+        return self._parse_decision(text)[0]
+
+    def _parse_decision(self, text):
+        """
+        Parse an LLM response into a decision
+
+        Returns:
+            tuple: ({'choice': int, 'reason': str}, clean), where clean is True
+            only if the response was valid JSON with a valid choice
+        """
+        if _SHOW_LLM:
             print(f"\n--- LLM RESPONSE ---\n{text}\n--------------------\n")
 
         try:
-            # Remove markdown code blocks if present
-            clean_text = text.strip()
-            if "```json" in clean_text:
-                clean_text = clean_text.split("```json")[1].split("```")[0].strip()
-            elif "```" in clean_text:
-                clean_text = clean_text.split("```")[1].split("```")[0].strip()
-            
-            # Parse JSON
-            data = json.loads(clean_text)
+            # JSON mode answers with bare JSON; markdown code blocks are only
+            # stripped when that fails (e.g. Batch API results)
+            try:
+                data = json.loads(text)
+            except json.JSONDecodeError:
+                fence = _FENCE_RE.search(text)
+                data = json.loads(fence.group(1).strip() if fence else text.strip())
             choice = int(data.get('choice', 1)) # Default to 1 if missing
             reason = data.get('reason', "No reason provided.")
             
             # Convert 1-based index (1-3) to 0-based index (0-2)
             if 1 <= choice <= 3:
-                return {'choice': choice - 1, 'reason': reason}
+                return {'choice': choice - 1, 'reason': reason}, True
                 
         except (json.JSONDecodeError, ValueError, AttributeError, TypeError) as e:
-            print(f"Error parsing LLM response: {e}")
+            logger.warning("Error parsing LLM response: %s", e)
             
             # Use the full text as the reason
             reason = text
             
             # Try to salvage a choice number (1-3)
-            choice = random.randint(1, 3)
-            for char in text:
-                if char.isdigit():
-                    num = int(char)
-                    if 1 <= num <= 3:
-                        choice = num
-                        break
+            match = _FIRST_CHOICE_RE.search(text)
+            choice = int(match.group()) if match else _fallback_rng.randint(1, 3)
             
-            return {'choice': choice - 1, 'reason': reason}
+            return {'choice': choice - 1, 'reason': reason}, False
 
         # Fallback
-        return {'choice': random.randint(0, 2), 'reason': text if text else "Communication error."}
\ No newline at end of file
+        return {'choice': _fallback_rng.randint(0, 2), 'reason': text if text else "Communication error."}, False
\ No newline at end of file
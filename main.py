@@ -6,19 +6,36 @@ import sys
 import json
 import os
 import pygame
+import queue
 import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from dotenv import load_dotenv
 
 load_dotenv()
 
 from settings import (
-    SCREEN_WIDTH, SCREEN_HEIGHT, INITIAL_WINDOW_WIDTH, INITIAL_WINDOW_HEIGHT, FPS,
+    SCREEN_WIDTH, SCREEN_HEIGHT, INITIAL_WINDOW_WIDTH, INITIAL_WINDOW_HEIGHT, FPS, IDLE_WAIT_MS, SMOOTH_SCALING,
     COLOR_BG, COLOR_TEXT, COLOR_ACCENT, COLOR_BUTTON,
+    LEFT_PANE, IMAGE_PANE, MENU_PANE,
     FONT_TITLE, FONT_NORMAL, FONT_SMALL,
     GameState
 )
 from ui_manager import draw_text, draw_multiline_text, draw_text_box, draw_menu_options, draw_text_right, measure_multiline_text
 from game_state import Game
+from llm_client import LLMClient
+
+# Posted by the AI worker thread when a decision is ready
+AI_DONE_EVENT = pygame.USEREVENT + 1
+
+# Image size inside a 580px split-screen column (minus the text box padding)
+SPLIT_PANEL_IMAGE_SIZE = (550, 280)
+
+# States whose top-right pane shows the current event's image
+_EVENT_BG_STATES = frozenset({GameState.EVENT_DISPLAY, GameState.PLAYER_EVENT_DISPLAY, GameState.AI_EVENT_DISPLAY})
+# Three-column states that draw their own panels instead of the two-pane layout
+_SPLIT_SCREEN_STATES = frozenset({GameState.SIMULTANEOUS_EVENT_DISPLAY, GameState.SIMULTANEOUS_RESULT_DISPLAY})
+# Keys that confirm the selected menu option
+_CONFIRM_KEYS = frozenset({pygame.K_RETURN, pygame.K_SPACE})
 
 
 def load_game_data(filepath):
@@ -49,59 +66,173 @@ class MarsColonyGame:
             pygame.RESIZABLE
         )
         # Create the virtual surface for fixed-resolution rendering
-        self.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
         
         pygame.display.set_caption("Mars Colony Manager")
         self.clock = pygame.time.Clock()
 
+        # Only these events are used; SDL drops everything else (mouse
+        # motion, focus changes, ...) before it reaches the queue. TEXTINPUT
+        # must stay allowed for KEYDOWN.unicode to follow the keyboard layout,
+        # and expose events tell us when the window contents need repainting.
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([
+            pygame.QUIT, pygame.VIDEORESIZE, pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED,
+            pygame.KEYDOWN, pygame.TEXTINPUT, AI_DONE_EVENT,
+        ])
+
         # Load fonts
         # Use system monospace font for better symbol support (arrows) and retro look
         # pygame.font.SysFont(name, size) - name can be a comma-separated list of preferences
         font_prefs = 'couriernew,courier,monospace'
-        self.font_title = pygame.font.SysFont(font_prefs, FONT_TITLE, bold=True)
-        self.font_normal = pygame.font.SysFont(font_prefs, FONT_NORMAL, bold=True)
-        self.font_small = pygame.font.SysFont(font_prefs, FONT_SMALL, bold=True)
+        # Resolve the font file once and build each size from the path, instead
+        # of repeating the SysFont name lookup per size. match_font falls back
+        # to the regular face (or None) when there is no bold one, in which
+        # case bold is synthesized, as SysFont does.
+        font_path = pygame.font.match_font(font_prefs, bold=True)
+        synthetic_bold = font_path is None or font_path == pygame.font.match_font(font_prefs)
+        self.font_title = pygame.font.Font(font_path, FONT_TITLE)
+        self.font_normal = pygame.font.Font(font_path, FONT_NORMAL)
+        self.font_small = pygame.font.Font(font_path, FONT_SMALL)
+        for font in (self.font_title, self.font_normal, self.font_small):
+            font.bold = synthetic_bold
 
         # Load game data and initialize game state
         game_data = load_game_data('gamedata.json')
         self.game = Game(game_data)
 
+        # Build the LLM client on a startup thread, so SDK setup overlaps with
+        # asset loading instead of stalling the first AI turn
+        self.llm_client = None
+        self._llm_client_thread = threading.Thread(target=self._init_llm_client, daemon=True)
+        self._llm_client_thread.start()
+
         # API Key Check
         self.api_key_input_text = ""
         self.api_key_error = None
         if not os.getenv("GEMINI_API_KEY"):
             self.game.current_state = GameState.API_KEY_INPUT
         
-        # Load background images
-        self.default_bg = None
+        # Collect every startup image: the backgrounds plus one per event
+        image_jobs = []
         default_bg_path = game_data.get('config', {}).get('default_background')
         if default_bg_path:
-            self.default_bg = self.load_and_scale_image(default_bg_path)
-            
-        # Load thinking background
-        self.thinking_bg = None
+            image_jobs.append(('default_bg', default_bg_path))
+
         thinking_images = game_data.get('config', {}).get('thinking_images', [])
         if thinking_images:
             import random
-            thinking_path = random.choice(thinking_images)
-            self.thinking_bg = self.load_and_scale_image(thinking_path)
-        
-        # Cache event images
-        self.event_images = {}
+            image_jobs.append(('thinking_bg', random.choice(thinking_images)))
+
         for event in self.game.events:
             if event.get('image'):
-                img = self.load_and_scale_image(event['image'])
-                if img:
-                    self.event_images[event['id']] = img
+                image_jobs.append((event['id'], event['image']))
+
+        # Failure and game over images, shown on result and elimination screens
+        result_paths = {game_data.get('config', {}).get('game_over_image')}
+        result_paths.update(option.get('fail_image') for event in self.game.events for option in event['options'])
+        result_paths.discard(None)
+        result_paths = sorted(result_paths)
+
+        # Read and decode them in parallel: PNG decoding and file reads
+        # happen in C and release the GIL. Converting to the display format
+        # and scaling stay on the main thread, which owns the display.
+        paths = [path for _, path in image_jobs] + result_paths
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            decoded = list(pool.map(self.decode_image, paths))
+        images = [self.load_and_scale_image(path, img) if img else None for path, img in zip(paths, decoded)]
+        result_images = images[len(image_jobs):]
+        # Flatten each onto the pane colour: an opaque pane image replaces
+        # the clear-then-blend of the image pane with one plain copy
+        loaded = {key: self._compose_pane(img) for (key, _), img in zip(image_jobs, images) if img}
+
+        self.default_bg = loaded.pop('default_bg', None)
+        self.thinking_bg = loaded.pop('thinking_bg', None)
+        # Cache event images
+        self.event_images = loaded
+        # Scaled copies for the split-screen panels and result images loaded
+        # later on, see get_event_image and get_image
+        self._scaled_event_images = {}
+        self._image_cache = {(path, None): img for path, img in zip(result_paths, result_images)}
+        # Scale the split-screen variants now too, so no screen ever waits
+        # on the disk or the scaler the first time it is shown
+        for event_id in self.event_images:
+            self.get_event_image(event_id, SPLIT_PANEL_IMAGE_SIZE)
+        for path in result_paths:
+            self.get_image(path, SPLIT_PANEL_IMAGE_SIZE)
+
+        # Option menus per event, built once rather than on every frame:
+        # the plain labels, and one variant per option with the AI's pick marked
+        self.option_menus = {}
+        self.ai_marked_menus = {}
+        for event in self.game.events:
+            texts = tuple(option['text'] for option in event['options'])
+            self.option_menus[event['id']] = texts
+            for i in range(len(texts)):
+                self.ai_marked_menus[(event['id'], i)] = texts[:i] + (f"{texts[i]} (AI)",) + texts[i + 1:]
 
         # UI state for menu navigation
-        self.menu_options = []  # List of text strings for current menu
+        self.menu_options = ()  # Text strings for current menu, rebound per state
         self.selected_option_index = 0  # Track which option is selected with keyboard
         
         # AI Threading state
         self.ai_decision_data = None
-        self.ai_thread = None
+        self.ai_future = None
         self.game_session_id = 0
+        # One long-lived daemon worker serves every AI request, instead of a
+        # new thread per event (daemon, so quitting never waits on the API)
+        self._ai_jobs = queue.Queue()
+        threading.Thread(target=self._run_ai_jobs, daemon=True).start()
+
+        # Per-state render and menu-selection handlers
+        self._render_dispatch = {
+            GameState.START_SCREEN: self.render_start_screen,
+            GameState.API_KEY_INPUT: self.render_api_key_input,
+            GameState.MODE_SELECT: self.render_mode_select,
+            GameState.AI_THINKING: self.render_ai_thinking,
+            GameState.AI_EVENT_DISPLAY: self.render_ai_event_display,
+            GameState.AI_RESULT_DISPLAY: self.render_result_display,
+            GameState.SIMULTANEOUS_EVENT_DISPLAY: self.render_simultaneous_event,
+            GameState.SIMULTANEOUS_RESULT_DISPLAY: self.render_simultaneous_result,
+            GameState.PLAYER_EVENT_DISPLAY: self.render_player_event_display,
+            GameState.EVENT_DISPLAY: self.render_event_display,
+            GameState.RESULT_DISPLAY: self.render_result_display,
+            GameState.COMPARISON: self.render_comparison,
+            GameState.GAME_OVER: self.render_game_over,
+            GameState.VICTORY: self.render_victory,
+        }
+        self._select_dispatch = {
+            GameState.MODE_SELECT: self._on_mode_select,
+            GameState.AI_THINKING: self._on_ai_thinking,
+            GameState.AI_EVENT_DISPLAY: self._on_ai_event_display,
+            GameState.AI_RESULT_DISPLAY: self._on_ai_result_display,
+            GameState.SIMULTANEOUS_EVENT_DISPLAY: self._on_simultaneous_event_display,
+            GameState.SIMULTANEOUS_RESULT_DISPLAY: self._on_simultaneous_result_display,
+            GameState.PLAYER_EVENT_DISPLAY: self._on_player_event_display,
+            GameState.EVENT_DISPLAY: self._on_event_display,
+            GameState.RESULT_DISPLAY: self._on_result_display,
+            GameState.COMPARISON: self._on_comparison,
+            GameState.GAME_OVER: self._on_game_over,
+            GameState.VICTORY: self._on_victory,
+        }
+
+        # Redraw tracking: nothing on screen animates, so a frame only needs
+        # redrawing after input (including AI_DONE_EVENT), a state change or a resize
+        self._screen_dirty = True
+        self._last_window_size = None
+        self._last_rendered_state = None
+        self._last_render_ticks = 0
+        self._scaled_dest = None
+
+    def _delta_texts(self, outcome):
+        """Return the population and QoL change lines for an outcome, formatted once"""
+        texts = outcome.get('delta_texts')
+        if texts is None:
+            # Outcomes never change once made, so keep the strings with them
+            old, new = outcome['old_stats'], outcome['new_stats']
+            texts = outcome['delta_texts'] = (f"Population: {old.pop} -> {new.pop}",
+                                              f"Quality of Life: {old.qol} -> {new.qol}")
+        return texts
 
     def _draw_nav_hint(self, bottom_pane_rect):
         """Draw navigation hint in the bottom right of the given rectangle."""
@@ -120,18 +251,83 @@ class MarsColonyGame:
             bottom_y + bottom_h - self.font_small.get_height() - 5 # 5 pixels padding from bottom
         )
 
-    def load_and_scale_image(self, path):
-        """Load an image and scale it to screen dimensions"""
+    def load_and_scale_image(self, path, img=None):
+        """
+        Load an image and scale it to screen dimensions
+
+        Args:
+            path: image file path
+            img: the already decoded file, see decode_image
+        """
+        if img is None:
+            img = self.decode_image(path)
+        if img is None:
+            return None
+        # Convert to the display's pixel format once, so every blit
+        # takes SDL's fast path instead of converting per frame
+        img = img.convert_alpha()
+        # Scale to fit the top-right pane (790x500)
+        return pygame.transform.scale(img, IMAGE_PANE[2:])
+
+    @staticmethod
+    def decode_image(path):
+        """Read and decode an image file, safe to call from a worker thread"""
         try:
             # Normalize path for OS (handles / vs \ on Windows)
-            norm_path = os.path.normpath(path)
-            img = pygame.image.load(norm_path)
-            # Scale to fit the top-right pane (790x500)
-            return pygame.transform.scale(img, (790, 500))
+            return pygame.image.load(os.path.normpath(path))
         except (pygame.error, FileNotFoundError):
             print(f"Warning: Could not load image at {path}")
             return None
 
+    def get_image(self, path, size=None):
+        """
+        Return the image at path, loaded and scaled only the first time
+
+        Args:
+            path: image file path
+            size: (width, height) to scale to, defaults to the right pane size
+
+        Returns:
+            pygame.Surface, or None if the image could not be loaded
+        """
+        key = (path, size)
+        if key not in self._image_cache:
+            img = self.get_image(path) if size else self.load_and_scale_image(path)
+            # Missing images are cached too, so the warning is printed once
+            self._image_cache[key] = pygame.transform.scale(img, size) if img and size else img
+        return self._image_cache[key]
+
+    def get_event_image(self, event_id, size):
+        """Return the cached event image scaled to size, scaling it only once"""
+        key = (event_id, size)
+        if key not in self._scaled_event_images:
+            self._scaled_event_images[key] = pygame.transform.scale(self.event_images[event_id], size)
+        return self._scaled_event_images[key]
+
+    def _compose_pane(self, img):
+        """Return img pre-blended onto the background colour as an opaque surface"""
+        pane = pygame.Surface(img.get_size()).convert()
+        pane.fill(COLOR_BG)
+        pane.blit(img, (0, 0))
+        return pane
+
+    def _pane_background(self):
+        """Return the image for the top-right pane in the current state, if any"""
+        state = self.game.current_state
+        if state == GameState.AI_THINKING and self.thinking_bg:
+            return self.thinking_bg
+        if state in _EVENT_BG_STATES:
+            event = self.game.get_current_event()
+            event_bg = self.event_images.get(event['id']) if event else None
+            if event_bg:
+                return event_bg
+        # Fallback to default background if no event bg or not in event state
+        return self.default_bg
+
+    def _init_llm_client(self):
+        """Create the LLM client for the current GEMINI_API_KEY"""
+        self.llm_client = LLMClient()
+
     def save_api_key(self, key):
         """Save API key to .env file and update environment"""
         try:
@@ -164,40 +360,74 @@ class MarsColonyGame:
                     f.write(f"GEMINI_API_KEY={key}\n")
             
             print("API Key saved.")
+
+            # Rebuild the client so it picks up the new key
+            self._llm_client_thread.join()
+            self._init_llm_client()
             
         except Exception as e:
             print(f"Error saving API key: {e}")
             self.api_key_error = str(e)
 
-    def start_ai_thread(self):
-        """Start a background thread to get AI decision"""
+    def _run_ai_jobs(self):
+        """Worker loop: run queued AI requests one at a time"""
+        while True:
+            future, job = self._ai_jobs.get()
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(job())
+                except BaseException as e:
+                    future.set_exception(e)
+
+    def start_ai_thread(self, event_index=None, stats=None):
+        """
+        Queue an AI decision request on the background worker
+
+        Args:
+            event_index: Event to decide on, defaults to the current event
+            stats: Stats shown to the AI, defaults to the AI's current stats
+        """
         self.ai_decision_data = None
-        event = self.game.get_current_event()
-        if not event:
+        if event_index is None:
+            event_index = self.game.current_event_index
+        if event_index >= len(self.game.events):
             return
-
-        # Ensure client exists
-        if not hasattr(self, 'llm_client'):
-            from llm_client import LLMClient
-            self.llm_client = LLMClient()
+        event = self.game.events[event_index]
+        if stats is None:
+            # Simultaneous mode tracks the AI separately from the player
+            stats = self.game.ai_stats if self.game.gameplay_mode == 'simultaneous' else self.game.stats
 
         current_session_id = self.game_session_id
 
         def target():
             try:
+                # The client may still be starting up; wait here, off the main thread
+                self._llm_client_thread.join()
                 # Returns dict {'choice': int, 'reason': str}
-                result = self.llm_client.get_ai_decision(event, self.game.stats)
-                self.ai_decision_data = {'result': result, 'session_id': current_session_id}
+                result = self.llm_client.get_ai_decision(event, stats)
+                self.ai_decision_data = {'result': result, 'session_id': current_session_id, 'event_index': event_index}
             except Exception as e:
                 print(f"AI Error: {e}")
-                self.ai_decision_data = {'result': {'choice': 0, 'reason': "Error in AI processing."}, 'session_id': current_session_id}
+                self.ai_decision_data = {'result': {'choice': 0, 'reason': "Error in AI processing."}, 'session_id': current_session_id, 'event_index': event_index}
+            # Wake the main loop instead of having it poll for the result
+            # (unless the game has already shut pygame down)
+            if pygame.display.get_init():
+                pygame.event.post(pygame.event.Event(AI_DONE_EVENT, session_id=current_session_id))
+
+        # A request still waiting in the queue is superseded by this one
+        if self.ai_future:
+            self.ai_future.cancel()
+        self.ai_future = Future()
+        self._ai_jobs.put((self.ai_future, target))
+
+    def handle_events(self, events=None):
+        """Handle pygame events, by default everything currently queued"""
+        if events is None:
+            events = pygame.event.get()
+        for event in events:
+            # Every handled event can change what is on screen
+            self._screen_dirty = True
 
-        self.ai_thread = threading.Thread(target=target, daemon=True)
-        self.ai_thread.start()
-
-    def handle_events(self):
-        """Handle pygame events"""
-        for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 return False
 
@@ -205,6 +435,11 @@ class MarsColonyGame:
                 # Update display window size
                 self.display_window = pygame.display.set_mode((event.w, event.h), pygame.RESIZABLE)
 
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                # The window was uncovered: present all of it, letterbox bars
+                # included, on the next render
+                self._last_window_size = None
+
             if event.type == pygame.KEYDOWN:
                 # F11 for Fullscreen toggle
                 if event.key == pygame.K_F11:
@@ -251,7 +486,7 @@ class MarsColonyGame:
                         self.selected_option_index = (self.selected_option_index + 1) % len(self.menu_options)
 
                 # Enter or Space to confirm selection
-                elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
+                elif event.key in _CONFIRM_KEYS:
                     if len(self.menu_options) > 0:
                         self.handle_menu_selection(self.selected_option_index)
                         self.selected_option_index = 0  # Reset for next screen
@@ -260,196 +495,219 @@ class MarsColonyGame:
 
     def handle_menu_selection(self, option_index):
         """Handle menu option selection based on current state"""
-        if self.game.current_state == GameState.MODE_SELECT:
-            # Only one option: Start Simulation
-            if option_index == 0:
-                self.game.start_simultaneous_mode()
-                self.ai_decision_data = None # Clear stale data
-                self.game_session_id += 1 # Invalidate old threads
-                # self.game.gameplay_mode = 'ai_vs_human'
-                # self.game.initialize_seed()
-                # self.game.start_ai_phase()
-                # AI thread starts in AI_EVENT_DISPLAY now
-
-        elif self.game.current_state == GameState.AI_THINKING:
-            # Only option: "See Decision" (when ready)
-            if option_index == 0 and self.ai_decision_data is not None:
-                self.process_ai_decision()
-
-        elif self.game.current_state == GameState.AI_EVENT_DISPLAY:
-            if self.game.selected_option is None:
-                # Initial view: Player clicks "Let AI Decide"
-                self.start_ai_thread()
-                self.game.current_state = GameState.AI_THINKING
-            else:
-                # After choice: Player clicks "Next" to see result or Game Over
-                if self.game.outcome_data['success']:
-                    self.game.current_state = GameState.AI_RESULT_DISPLAY
-                else:
-                    # AI failed
-                    self.game.ai_game_over_handler()
-
-        elif self.game.current_state == GameState.AI_RESULT_DISPLAY:
-            # Only option: "Next" (index 0)
-            self.game.ai_advance_to_next_event()
-            if self.game.current_state == GameState.VICTORY:
-                # AI completed, start player phase
-                self.game.start_player_phase()
-
-        elif self.game.current_state == GameState.SIMULTANEOUS_EVENT_DISPLAY:
-            # Player selects option (0, 1, 2)
-            # Only allow if AI has finished thinking (optional, but requested "sees ai choice")
-            if self.game.simultaneous_data['ai_choice'] is not None:
-                if self.game.player_game_over:
-                    # Player is eliminated, button is "Continue Watching"
-                    if option_index == 0:
-                        self.game.skip_simultaneous_player_turn()
-                else:
-                    self.game.process_simultaneous_player_decision(option_index)
-
-        elif self.game.current_state == GameState.SIMULTANEOUS_RESULT_DISPLAY:
-            # Next button
-            self.game.advance_simultaneous_next_event()
-
-        elif self.game.current_state == GameState.PLAYER_EVENT_DISPLAY:
-            # Player selects from 3 options (0, 1, 2)
-            self.game.player_select_option(option_index)
-
-        elif self.game.current_state == GameState.EVENT_DISPLAY:
-            # Select from 3 options (0, 1, 2)
-            self.game.select_option(option_index)
-
-        elif self.game.current_state == GameState.RESULT_DISPLAY:
-            # Only option: "Next" (index 0)
-            if self.game.current_phase == 'player':
-                self.game.player_advance_to_next_event()
+        handler = self._select_dispatch.get(self.game.current_state)
+        if handler:
+            handler(option_index)
+
+    def _on_mode_select(self, option_index):
+        # Only one option: Start Simulation
+        if option_index == 0:
+            self.game.start_simultaneous_mode()
+            self.ai_decision_data = None # Clear stale data
+            self.game_session_id += 1 # Invalidate old threads
+            # self.game.gameplay_mode = 'ai_vs_human'
+            # self.game.initialize_seed()
+            # self.game.start_ai_phase()
+            # AI thread starts in AI_EVENT_DISPLAY now
+
+    def _on_ai_thinking(self, option_index):
+        # Only option: "See Decision" (when ready)
+        if option_index == 0 and self.ai_decision_data is not None:
+            self.process_ai_decision()
+
+    def _on_ai_event_display(self, option_index):
+        if self.game.selected_option is None:
+            # Initial view: Player clicks "Let AI Decide"
+            self.start_ai_thread()
+            self.game.current_state = GameState.AI_THINKING
+        else:
+            # After choice: Player clicks "Next" to see result or Game Over
+            if self.game.outcome_data['success']:
+                self.game.current_state = GameState.AI_RESULT_DISPLAY
             else:
-                self.game.advance_to_next_event()
-
-        elif self.game.current_state == GameState.COMPARISON:
-            # Only option: "Play Again" (index 0)
-            self.game.restart_game()
-            self.game.current_state = GameState.MODE_SELECT
-
-        elif self.game.current_state == GameState.GAME_OVER:
-            # Only option: "Restart" or continue (index 0)
-            if self.game.current_phase == 'ai':
-                # AI failed, proceed to player phase
+                # AI failed
                 self.game.ai_game_over_handler()
-                self.game.start_player_phase()
-            elif self.game.current_phase == 'player':
-                # Player failed, go to comparison
-                self.game.current_state = GameState.COMPARISON
-            else:
-                # Regular restart
-                self.game.restart_game()
-
-        elif self.game.current_state == GameState.VICTORY:
-            # Only option: "Continue" or "Restart" (index 0)
-            if self.game.current_phase == 'ai':
-                # AI won, start player phase
-                self.game.start_player_phase()
-            elif self.game.current_phase == 'player':
-                # Player won, show comparison
-                self.game.current_state = GameState.COMPARISON
-            else:
-                # Regular restart
-                self.game.restart_game()
-
-    def render(self):
-        """Render the current game state"""
-        # 1. Render everything to the fixed-resolution virtual screen
-        self.screen.fill(COLOR_BG)
-
-        # Draw background
-        bg_drawn = False
-        
-        # If in simultaneous mode, do not draw default backgrounds, as each panel draws its own
-        if self.game.current_state in [GameState.SIMULTANEOUS_EVENT_DISPLAY, GameState.SIMULTANEOUS_RESULT_DISPLAY]:
-            bg_drawn = True
 
-        # Check for AI thinking specific background
-        if self.game.current_state == GameState.AI_THINKING and self.thinking_bg:
-            self.screen.blit(self.thinking_bg, (930, 20))
-            bg_drawn = True
-        
-        # Check for event specific background
-        elif self.game.current_state in [GameState.EVENT_DISPLAY, GameState.PLAYER_EVENT_DISPLAY, GameState.AI_EVENT_DISPLAY]:
-            event = self.game.get_current_event()
-            if event and event['id'] in self.event_images:
-                self.screen.blit(self.event_images[event['id']], (930, 20))
-                bg_drawn = True
-        
-        # Fallback to default background if no event bg or not in event state
-        if not bg_drawn and self.default_bg:
-            self.screen.blit(self.default_bg, (930, 20))
-
-        if self.game.current_state == GameState.START_SCREEN:
-            self.render_start_screen()
+    def _on_ai_result_display(self, option_index):
+        # Only option: "Next" (index 0)
+        self.game.ai_advance_to_next_event()
+        if self.game.current_state == GameState.VICTORY:
+            # AI completed, start player phase
+            self.game.start_player_phase()
+
+    def _on_simultaneous_event_display(self, option_index):
+        # Player selects option (0, 1, 2)
+        # Only allow if AI has finished thinking (optional, but requested "sees ai choice")
+        if self.game.simultaneous_data['ai_choice'] is not None:
+            if self.game.player_game_over:
+                # Player is eliminated, button is "Continue Watching"
+                if option_index == 0:
+                    self.game.skip_simultaneous_player_turn()
+            else:
+                self.game.process_simultaneous_player_decision(option_index)
 
-        elif self.game.current_state == GameState.API_KEY_INPUT:
-            self.render_api_key_input()
+    def _on_simultaneous_result_display(self, option_index):
+        # Next button
+        self.game.advance_simultaneous_next_event()
 
-        elif self.game.current_state == GameState.MODE_SELECT:
-            self.render_mode_select()
+    def _on_player_event_display(self, option_index):
+        # Player selects from 3 options (0, 1, 2)
+        self.game.player_select_option(option_index)
 
-        elif self.game.current_state == GameState.AI_THINKING:
-            self.render_ai_thinking()
+    def _on_event_display(self, option_index):
+        # Select from 3 options (0, 1, 2)
+        self.game.select_option(option_index)
 
-        elif self.game.current_state == GameState.AI_EVENT_DISPLAY:
-            self.render_ai_event_display()
+    def _on_result_display(self, option_index):
+        # Only option: "Next" (index 0)
+        if self.game.current_phase == 'player':
+            self.game.player_advance_to_next_event()
+        else:
+            self.game.advance_to_next_event()
 
-        elif self.game.current_state == GameState.AI_RESULT_DISPLAY:
-            self.render_result_display()
+    def _on_comparison(self, option_index):
+        # Only option: "Play Again" (index 0)
+        self.game.restart_game()
+        self.game.current_state = GameState.MODE_SELECT
 
-        elif self.game.current_state == GameState.SIMULTANEOUS_EVENT_DISPLAY:
-            self.render_simultaneous_event()
+    def _on_game_over(self, option_index):
+        # Only option: "Restart" or continue (index 0)
+        if self.game.current_phase == 'ai':
+            # AI failed, proceed to player phase
+            self.game.ai_game_over_handler()
+            self.game.start_player_phase()
+        elif self.game.current_phase == 'player':
+            # Player failed, go to comparison
+            self.game.current_state = GameState.COMPARISON
+        else:
+            # Regular restart
+            self.game.restart_game()
 
-        elif self.game.current_state == GameState.SIMULTANEOUS_RESULT_DISPLAY:
-            self.render_simultaneous_result()
+    def _on_victory(self, option_index):
+        # Only option: "Continue" or "Restart" (index 0)
+        if self.game.current_phase == 'ai':
+            # AI won, start player phase
+            self.game.start_player_phase()
+        elif self.game.current_phase == 'player':
+            # Player won, show comparison
+            self.game.current_state = GameState.COMPARISON
+        else:
+            # Regular restart
+            self.game.restart_game()
 
-        elif self.game.current_state == GameState.PLAYER_EVENT_DISPLAY:
-            self.render_player_event_display()
+    def update(self):
+        """Advance game logic that does not depend on input, once per tick"""
+        if self.game.current_state != GameState.SIMULTANEOUS_EVENT_DISPLAY:
+            return
 
-        elif self.game.current_state == GameState.EVENT_DISPLAY:
-            self.render_event_display()
+        # If AI hasn't chosen yet
+        if self.game.simultaneous_data['ai_choice'] is None:
+            # Check if AI is already eliminated
+            if self.game.ai_game_over:
+                 self.game.simultaneous_data['ai_choice'] = -1
+                 self.game.simultaneous_data['ai_reason'] = "Eliminated."
+                 self.game.simultaneous_data['ai_outcome'] = {'success': False, 'message': "ELIMINATED", 'old_stats': self.game.ai_stats, 'new_stats': self.game.ai_stats}
+                 self._screen_dirty = True
+            else:
+                # Normal AI processing
+                # Check if we have a result from the thread
+                if (self.ai_decision_data and self.ai_decision_data.get('session_id') == self.game_session_id
+                        and self.ai_decision_data.get('event_index') == self.game.current_event_index):
+                    # Process it
+                    result = self.ai_decision_data['result']
+                    choice = result['choice']
+                    reason = result['reason']
+                    self.game.process_simultaneous_ai_decision(choice, reason)
+                    self.ai_decision_data = None # Clear for next time
+                    self._screen_dirty = True
+
+                    # Prefetch the AI's next decision while the player is still choosing
+                    next_turn = self.game.next_ai_turn()
+                    if next_turn:
+                        self.start_ai_thread(*next_turn)
+                # If no result and no request pending, start it
+                elif not (self.ai_future and not self.ai_future.done()):
+                    self.start_ai_thread()
 
-        elif self.game.current_state == GameState.RESULT_DISPLAY:
-            self.render_result_display()
+    def render(self):
+        """Render the current game state"""
+        window_size = self.display_window.get_size()
+        now = pygame.time.get_ticks()
+        if (not self._screen_dirty and window_size == self._last_window_size
+                and self.game.current_state == self._last_rendered_state
+                and now - self._last_render_ticks < 1000):
+            # Nothing changed since the last frame, the window still shows it.
+            # A full redraw still happens once a second in case the window
+            # manager discarded the window contents.
+            return
 
-        elif self.game.current_state == GameState.COMPARISON:
-            self.render_comparison()
+        layout_changed = self.game.current_state != self._last_rendered_state
+        # Resizes and the periodic safety redraw present the whole window;
+        # otherwise only the letterboxed game area changed
+        full_present = window_size != self._last_window_size or not self._screen_dirty
+        self._screen_dirty = False
+        self._last_window_size = window_size
+        self._last_rendered_state = self.game.current_state
+        self._last_render_ticks = now
 
-        elif self.game.current_state == GameState.GAME_OVER:
-            self.render_game_over()
+        # 1. Render everything to the fixed-resolution virtual screen
+        if layout_changed:
+            self.screen.fill(COLOR_BG)
 
-        elif self.game.current_state == GameState.VICTORY:
-            self.render_victory()
+        # If in simultaneous mode, do not draw default backgrounds, as each panel draws its own
+        if self.game.current_state not in _SPLIT_SCREEN_STATES:
+            # Otherwise the text boxes repaint their own background and the
+            # opaque pane image covers the rest; only clear when there is none
+            pane_bg = self._pane_background()
+            if pane_bg:
+                self.screen.blit(pane_bg, IMAGE_PANE[:2])
+            elif not layout_changed:
+                self.screen.fill(COLOR_BG, IMAGE_PANE)
+
+        renderer = self._render_dispatch.get(self.game.current_state)
+        if renderer:
+            renderer()
 
         # 2. Scale and blit the virtual screen to the actual display window
-        window_w, window_h = self.display_window.get_size()
+        window_w, window_h = window_size
         screen_w, screen_h = self.screen.get_size()
 
         scale = min(window_w / screen_w, window_h / screen_h)
         new_w = int(screen_w * scale)
         new_h = int(screen_h * scale)
 
-        # Use smoothscale for better quality
-        scaled_surface = pygame.transform.smoothscale(self.screen, (new_w, new_h))
+        if scale == 1.0:
+            scaled_surface = self.screen
+        else:
+            # Scale into a buffer kept between frames, reallocated only when the
+            # window size changes, rather than a fresh multi-MB Surface per frame
+            if self._scaled_dest is None or self._scaled_dest.get_size() != (new_w, new_h):
+                self._scaled_dest = pygame.Surface((new_w, new_h), 0, self.screen)
+            scaled_surface = self._scaled_dest
+            if SMOOTH_SCALING and not scale.is_integer():
+                # Bilinear filtering for fractional scales, if enabled in settings
+                pygame.transform.smoothscale(self.screen, (new_w, new_h), scaled_surface)
+            else:
+                # Nearest-neighbour keeps the retro pixels crisp and is much faster
+                pygame.transform.scale(self.screen, (new_w, new_h), scaled_surface)
         
         # Center the scaled surface
         x_offset = (window_w - new_w) // 2
         y_offset = (window_h - new_h) // 2
 
-        self.display_window.fill((0, 0, 0))  # Black bars for letterboxing
-        self.display_window.blit(scaled_surface, (x_offset, y_offset))
+        if full_present:
+            self.display_window.fill((0, 0, 0))  # Black bars for letterboxing
+        game_rect = self.display_window.blit(scaled_surface, (x_offset, y_offset))
 
-        pygame.display.flip()
+        if full_present:
+            pygame.display.flip()
+        else:
+            pygame.display.update(game_rect)
 
     def render_start_screen(self):
         """Render the start screen"""
         # Left Pane: Title
-        left_x, left_y, left_w, _ = draw_text_box(self.screen, 20, 20, 890, 860)
+        left_x, left_y, left_w, _ = draw_text_box(self.screen, *LEFT_PANE)
         
         # Title Text
         draw_text(self.screen, "MARS", self.font_title, COLOR_TEXT, left_x + left_w // 2, left_y + 150, center=True)
@@ -457,7 +715,7 @@ class MarsColonyGame:
         draw_text(self.screen, "MANAGER", self.font_title, COLOR_TEXT, left_x + left_w // 2, left_y + 250, center=True)
 
         # Bottom Right Pane: Prompt
-        bottom_x, bottom_y, bottom_w, bottom_h = draw_text_box(self.screen, 930, 540, 790, 340)
+        bottom_x, bottom_y, bottom_w, bottom_h = draw_text_box(self.screen, *MENU_PANE)
         
         draw_text(
             self.screen,
@@ -473,7 +731,7 @@ class MarsColonyGame:
     def render_api_key_input(self):
         """Render API Key input screen"""
         # Left Pane: Instructions
-        left_x, left_y, left_w, _ = draw_text_box(self.screen, 20, 20, 890, 860)
+        left_x, left_y, left_w, _ = draw_text_box(self.screen, *LEFT_PANE)
         
         draw_text(self.screen, "SETUP", self.font_title, COLOR_ACCENT, left_x, left_y)
         
@@ -508,7 +766,7 @@ class MarsColonyGame:
         )
         
         # Bottom Right Pane: Input
-        bottom_x, bottom_y, bottom_w, bottom_h = draw_text_box(self.screen, 930, 540, 790, 340)
+        bottom_x, bottom_y, bottom_w, bottom_h = draw_text_box(self.screen, *MENU_PANE)
         
         draw_text(self.screen, "ENTER API KEY:", self.font_normal, COLOR_ACCENT, bottom_x, bottom_y)
         
@@ -557,7 +815,7 @@ class MarsColonyGame:
         explanation_text = self.game.config.get('game_explanation', 'Compare your choices with AI.')
 
         # Left Pane: Intro
-        left_x, left_y, left_w, _ = draw_text_box(self.screen, 20, 20, 890, 860)
+        left_x, left_y, left_w, _ = draw_text_box(self.screen, *LEFT_PANE)
         
         draw_text(self.screen, intro_title, self.font_title, COLOR_TEXT, left_x, left_y)
         
@@ -572,7 +830,7 @@ class MarsColonyGame:
         )
 
         # Bottom Right Pane: Explanation and Start
-        bottom_x, bottom_y, bottom_w, bottom_h = draw_text_box(self.screen, 930, 540, 790, 340)
+        bottom_x, bottom_y, bottom_w, bottom_h = draw_text_box(self.screen, *MENU_PANE)
 
         # Explanation text above the button
         draw_multiline_text(
@@ -586,7 +844,7 @@ class MarsColonyGame:
         )
 
         # Menu options
-        self.menu_options = ["Start Simulation"]
+        self.menu_options = ("Start Simulation",)
         draw_menu_options(
             self.screen,
             self.menu_options,
@@ -601,7 +859,7 @@ class MarsColonyGame:
     def render_ai_thinking(self):
         """Show AI is making a decision"""
         # Left Pane: Status
-        left_x, left_y, left_w, _ = draw_text_box(self.screen, 20, 20, 890, 860)
+        left_x, left_y, left_w, _ = draw_text_box(self.screen, *LEFT_PANE)
 
         draw_text(
             self.screen,
@@ -632,7 +890,7 @@ class MarsColonyGame:
                 left_y + 90,
                 left_w
             )
-            self.menu_options = []
+            self.menu_options = ()
         else:
             # Decision ready
             draw_multiline_text(
@@ -646,9 +904,9 @@ class MarsColonyGame:
             )
             
             # Bottom Right Pane: Action
-            bottom_x, bottom_y, bottom_w, bottom_h = draw_text_box(self.screen, 930, 540, 790, 340)
+            bottom_x, bottom_y, bottom_w, bottom_h = draw_text_box(self.screen, *MENU_PANE)
             
-            self.menu_options = ["See Decision"]
+            self.menu_options = ("See Decision",)
             draw_menu_options(
                 self.screen,
                 self.menu_options,
@@ -667,7 +925,7 @@ class MarsColonyGame:
             return
 
         # Left Pane: Event Info
-        left_x, left_y, left_w, left_h = draw_text_box(self.screen, 20, 20, 890, 860)
+        left_x, left_y, left_w, left_h = draw_text_box(self.screen, *LEFT_PANE)
 
         draw_text(
             self.screen,
@@ -739,11 +997,11 @@ class MarsColonyGame:
             )
         
         # Bottom Right Pane: Action
-        bottom_x, bottom_y, bottom_w, bottom_h = draw_text_box(self.screen, 930, 540, 790, 340)
+        bottom_x, bottom_y, bottom_w, bottom_h = draw_text_box(self.screen, *MENU_PANE)
 
         if self.game.selected_option is None:
             # Initial state: Prompt user to trigger AI
-            self.menu_options = ["Let AI Decide"]
+            self.menu_options = ("Let AI Decide",)
             draw_menu_options(
                 self.screen,
                 self.menu_options,
@@ -758,7 +1016,7 @@ class MarsColonyGame:
             # But we need to communicate flow. Maybe just "Next".
             
             # Next menu option
-            self.menu_options = ["Next"]
+            self.menu_options = ("Next",)
             draw_menu_options(
                 self.screen,
                 self.menu_options,
@@ -777,10 +1035,10 @@ class MarsColonyGame:
             return
 
         # Left Pane: Description
-        left_x, left_y, left_w, _ = draw_text_box(self.screen, 20, 20, 890, 860)
+        left_x, left_y, left_w, _ = draw_text_box(self.screen, *LEFT_PANE)
 
         # Stats display (in left pane top)
-        stats_text = f"Population: {self.game.stats['pop']} | Quality of Life: {self.game.stats['qol']}"
+        stats_text = f"Population: {self.game.stats.pop} | Quality of Life: {self.game.stats.qol}"
         draw_text(self.screen, stats_text, self.font_small, COLOR_ACCENT, left_x, left_y)
 
         draw_multiline_text(
@@ -804,10 +1062,10 @@ class MarsColonyGame:
         )
 
         # Bottom Right Pane: Options
-        bottom_x, bottom_y, bottom_w, bottom_h = draw_text_box(self.screen, 930, 540, 790, 340)
+        bottom_x, bottom_y, bottom_w, bottom_h = draw_text_box(self.screen, *MENU_PANE)
 
         # Menu options
-        self.menu_options = [option['text'] for option in event['options']]
+        self.menu_options = self.option_menus[event['id']]
         menu_height = draw_menu_options(
             self.screen,
             self.menu_options,
@@ -842,7 +1100,7 @@ class MarsColonyGame:
             return
 
         # Left Pane: Description
-        left_x, left_y, left_w, left_h = draw_text_box(self.screen, 20, 20, 890, 860)
+        left_x, left_y, left_w, left_h = draw_text_box(self.screen, *LEFT_PANE)
 
         # Phase indicator
         draw_text(
@@ -855,7 +1113,7 @@ class MarsColonyGame:
         )
 
         # Stats display
-        stats_text = f"Population: {self.game.stats['pop']} | Quality of Life: {self.game.stats['qol']}"
+        stats_text = f"Population: {self.game.stats.pop} | Quality of Life: {self.game.stats.qol}"
         draw_text(self.screen, stats_text, self.font_small, COLOR_ACCENT, left_x, left_y + 25)
 
         draw_multiline_text(
@@ -920,17 +1178,12 @@ class MarsColonyGame:
             )
         
         # Bottom Right Pane: Options
-        bottom_x, bottom_y, bottom_w, bottom_h = draw_text_box(self.screen, 930, 540, 790, 340)
+        bottom_x, bottom_y, bottom_w, bottom_h = draw_text_box(self.screen, *MENU_PANE)
         
         current_y = bottom_y
 
         # Menu options with AI choice marked
-        self.menu_options = []
-        for i, option in enumerate(event['options']):
-            if i == ai_choice_index:
-                self.menu_options.append(f"{option['text']} (AI)")
-            else:
-                self.menu_options.append(option['text'])
+        self.menu_options = self.ai_marked_menus.get((event['id'], ai_choice_index), self.option_menus[event['id']])
 
         menu_height = draw_menu_options(
             self.screen,
@@ -964,7 +1217,7 @@ class MarsColonyGame:
         comparison = self.game.calculate_comparison_data()
 
         # Left Pane: Results Table
-        left_x, left_y, left_w, _ = draw_text_box(self.screen, 20, 20, 890, 860)
+        left_x, left_y, left_w, _ = draw_text_box(self.screen, *LEFT_PANE)
 
         draw_text(
             self.screen,
@@ -981,9 +1234,9 @@ class MarsColonyGame:
         
         if comparison['ai']['completed']:
             ai_stats = comparison['ai']['stats']
-            draw_text(self.screen, f"Population: {ai_stats['pop']}", self.font_small, COLOR_TEXT, left_x, current_y + 30)
-            draw_text(self.screen, f"Quality of Life: {ai_stats['qol']}", self.font_small, COLOR_TEXT, left_x, current_y + 50)
-            total_ai = ai_stats['pop'] * ai_stats['qol']
+            draw_text(self.screen, f"Population: {ai_stats.pop}", self.font_small, COLOR_TEXT, left_x, current_y + 30)
+            draw_text(self.screen, f"Quality of Life: {ai_stats.qol}", self.font_small, COLOR_TEXT, left_x, current_y + 50)
+            total_ai = ai_stats.pop * ai_stats.qol
             draw_text(self.screen, f"TOTAL: {total_ai}", self.font_normal, COLOR_ACCENT, left_x, current_y + 80)
         else:
             draw_text(self.screen, "GAME OVER", self.font_small, COLOR_TEXT, left_x, current_y + 30)
@@ -994,9 +1247,9 @@ class MarsColonyGame:
 
         if comparison['player']['completed']:
             player_stats = comparison['player']['stats']
-            draw_text(self.screen, f"Population: {player_stats['pop']}", self.font_small, COLOR_TEXT, left_x, current_y + 30)
-            draw_text(self.screen, f"Quality of Life: {player_stats['qol']}", self.font_small, COLOR_TEXT, left_x, current_y + 50)
-            total_player = player_stats['pop'] * player_stats['qol']
+            draw_text(self.screen, f"Population: {player_stats.pop}", self.font_small, COLOR_TEXT, left_x, current_y + 30)
+            draw_text(self.screen, f"Quality of Life: {player_stats.qol}", self.font_small, COLOR_TEXT, left_x, current_y + 50)
+            total_player = player_stats.pop * player_stats.qol
             draw_text(self.screen, f"TOTAL: {total_player}", self.font_normal, COLOR_ACCENT, left_x, current_y + 80)
         else:
             draw_text(self.screen, "GAME OVER", self.font_small, COLOR_TEXT, left_x, current_y + 30)
@@ -1019,10 +1272,10 @@ class MarsColonyGame:
         )
 
         # Bottom Right Pane: Menu
-        bottom_x, bottom_y, bottom_w, bottom_h = draw_text_box(self.screen, 930, 540, 790, 340)
+        bottom_x, bottom_y, bottom_w, bottom_h = draw_text_box(self.screen, *MENU_PANE)
 
         # Menu option
-        self.menu_options = ["Play Again"]
+        self.menu_options = ("Play Again",)
         draw_menu_options(
             self.screen,
             self.menu_options,
@@ -1040,7 +1293,7 @@ class MarsColonyGame:
             return
 
         # Left Pane: Outcome Message & Stats
-        left_x, left_y, left_w, _ = draw_text_box(self.screen, 20, 20, 890, 860)
+        left_x, left_y, left_w, _ = draw_text_box(self.screen, *LEFT_PANE)
         
         # Success message
         draw_text(
@@ -1068,20 +1321,16 @@ class MarsColonyGame:
         # Only show stat changes if it's NOT the AI phase
         if self.game.current_phase != 'ai':
             # Stats changes
-            old_stats = self.game.outcome_data['old_stats']
-            new_stats = self.game.outcome_data['new_stats']
-
-            pop_text = f"Population: {old_stats['pop']} -> {new_stats['pop']}"
-            qol_text = f"Quality of Life: {old_stats['qol']} -> {new_stats['qol']}"
+            pop_text, qol_text = self._delta_texts(self.game.outcome_data)
 
             draw_text(self.screen, pop_text, self.font_normal, COLOR_TEXT, left_x, current_y)
             draw_text(self.screen, qol_text, self.font_normal, COLOR_TEXT, left_x, current_y + 30)
 
         # Bottom Right Pane: Menu
-        bottom_x, bottom_y, bottom_w, bottom_h = draw_text_box(self.screen, 930, 540, 790, 340)
+        bottom_x, bottom_y, bottom_w, bottom_h = draw_text_box(self.screen, *MENU_PANE)
 
         # Menu option
-        self.menu_options = ["Next"]
+        self.menu_options = ("Next",)
         draw_menu_options(
             self.screen,
             self.menu_options,
@@ -1099,7 +1348,7 @@ class MarsColonyGame:
             return
 
         # Left Pane: Fail Message
-        left_x, left_y, left_w, _ = draw_text_box(self.screen, 20, 20, 890, 860)
+        left_x, left_y, left_w, _ = draw_text_box(self.screen, *LEFT_PANE)
 
         # Game over title
         draw_text(
@@ -1117,7 +1366,7 @@ class MarsColonyGame:
         # Draw result image if available (now before text)
         result_image_path = self.game.outcome_data.get('result_image')
         if result_image_path:
-            img = self.load_and_scale_image(result_image_path)
+            img = self.get_image(result_image_path)
             if img:
                  # Image needs to be scaled to fit the left pane width (890px - padding)
                  # load_and_scale_image scales to 790x500 which is for right pane.
@@ -1143,7 +1392,7 @@ class MarsColonyGame:
 
 
         # Bottom Right Pane: Menu
-        bottom_x, bottom_y, bottom_w, bottom_h = draw_text_box(self.screen, 930, 540, 790, 340)
+        bottom_x, bottom_y, bottom_w, bottom_h = draw_text_box(self.screen, *MENU_PANE)
 
         # Determine button text based on context
         if self.game.current_phase == 'ai':
@@ -1154,7 +1403,7 @@ class MarsColonyGame:
             menu_text = "Restart"
 
         # Menu option
-        self.menu_options = [menu_text]
+        self.menu_options = (menu_text,)
         draw_menu_options(
             self.screen,
             self.menu_options,
@@ -1169,7 +1418,7 @@ class MarsColonyGame:
     def render_victory(self):
         """Render victory screen"""
         # Left Pane: Victory Info
-        left_x, left_y, left_w, _ = draw_text_box(self.screen, 20, 20, 890, 860)
+        left_x, left_y, left_w, _ = draw_text_box(self.screen, *LEFT_PANE)
 
         # Victory title
         draw_text(
@@ -1191,14 +1440,14 @@ class MarsColonyGame:
             left_y + 50
         )
 
-        pop_text = f"Population: {self.game.stats['pop']}"
-        qol_text = f"Quality of Life: {self.game.stats['qol']}"
+        pop_text = f"Population: {self.game.stats.pop}"
+        qol_text = f"Quality of Life: {self.game.stats.qol}"
 
         draw_text(self.screen, pop_text, self.font_normal, COLOR_TEXT, left_x, left_y + 90)
         draw_text(self.screen, qol_text, self.font_normal, COLOR_TEXT, left_x, left_y + 120)
 
         # Bottom Right Pane: Menu
-        bottom_x, bottom_y, bottom_w, bottom_h = draw_text_box(self.screen, 930, 540, 790, 340)
+        bottom_x, bottom_y, bottom_w, bottom_h = draw_text_box(self.screen, *MENU_PANE)
 
         # Determine button text based on context
         if self.game.current_phase == 'ai':
@@ -1209,7 +1458,7 @@ class MarsColonyGame:
             menu_text = "Restart"
 
         # Menu option
-        self.menu_options = [menu_text]
+        self.menu_options = (menu_text,)
         draw_menu_options(
             self.screen,
             self.menu_options,
@@ -1223,32 +1472,12 @@ class MarsColonyGame:
 
     def render_simultaneous_event(self):
         """Render split-screen simultaneous event"""
-        event = self.game.get_current_event()
+        game = self.game
+        sim = game.simultaneous_data
+        event = game.get_current_event()
         if not event:
             return
 
-        # --- AI Logic Check ---
-        # If AI hasn't chosen yet
-        if self.game.simultaneous_data['ai_choice'] is None:
-            # Check if AI is already eliminated
-            if self.game.ai_game_over:
-                 self.game.simultaneous_data['ai_choice'] = -1
-                 self.game.simultaneous_data['ai_reason'] = "Eliminated."
-                 self.game.simultaneous_data['ai_outcome'] = {'success': False, 'message': "ELIMINATED", 'old_stats': self.game.ai_stats, 'new_stats': self.game.ai_stats}
-            else:
-                # Normal AI processing
-                # Check if we have a result from the thread
-                if self.ai_decision_data and self.ai_decision_data.get('session_id') == self.game_session_id:
-                    # Process it
-                    result = self.ai_decision_data['result']
-                    choice = result['choice']
-                    reason = result['reason']
-                    self.game.process_simultaneous_ai_decision(choice, reason)
-                    self.ai_decision_data = None # Clear for next time
-                # If no result and no thread, start it
-                elif not (self.ai_thread and self.ai_thread.is_alive()):
-                    self.start_ai_thread()
-
         # --- Layout ---
         # 3 Columns: AI (Left), Text (Center), Player (Right)
         
@@ -1296,14 +1525,18 @@ class MarsColonyGame:
         draw_text(self.screen, "AI PLAYER", self.font_title, COLOR_ACCENT, ax + aw // 2, ay, center=True)
         
         # Stats
-        stats = self.game.ai_stats
-        draw_text(self.screen, f"Population: {stats['pop']} | Quality of Life: {stats['qol']}", self.font_normal, COLOR_TEXT, ax + aw // 2, ay + 40, center=True)
+        stats = game.ai_stats
+        draw_text(self.screen, f"Population: {stats.pop} | Quality of Life: {stats.qol}", self.font_normal, COLOR_TEXT, ax + aw // 2, ay + 40, center=True)
         
-        # Image
-        if event['id'] in self.event_images:
+        # Image: once the AI is out, its elimination image takes the place of
+        # the event image, so only one of the two is blitted
+        scaled_img = None
+        if sim['ai_choice'] == -1 and game.ai_elimination_image:
+            scaled_img = self.get_image(game.ai_elimination_image, (aw, 280))
+        if scaled_img is None and event['id'] in self.event_images:
             # Scale image to fit width (440 approx)
-            img = self.event_images[event['id']]
-            scaled_img = pygame.transform.scale(img, (aw, 280)) # fit width
+            scaled_img = self.get_event_image(event['id'], (aw, 280)) # fit width
+        if scaled_img:
             self.screen.blit(scaled_img, (ai_x + 15, ay + 80)) # Adjust for padding
             
         # Decision Status
@@ -1321,11 +1554,11 @@ class MarsColonyGame:
         # User said: "show failure of ai after player choice only".
         # So here, we should just show the CHOICE.
         
-        if self.game.simultaneous_data['ai_choice'] is None:
+        if sim['ai_choice'] is None:
             draw_text(self.screen, "THINKING...", self.font_title, COLOR_ACCENT, ax + aw//2, status_y, center=True)
         else:
             # AI has chosen. Even if eliminated internally, we masquerade it as just a choice here.
-            choice_idx = self.game.simultaneous_data['ai_choice']
+            choice_idx = sim['ai_choice']
             # If AI is eliminated, we might have set choice to -1. Handle that.
             if choice_idx == -1:
                  # It was eliminated previously? Or just now?
@@ -1346,15 +1579,10 @@ class MarsColonyGame:
             
             if choice_idx == -1:
                 draw_text(self.screen, "ELIMINATED", self.font_title, COLOR_TEXT, ax + aw//2, status_y, center=True)
-                if self.game.ai_elimination_image:
-                     img = self.load_and_scale_image(self.game.ai_elimination_image)
-                     if img:
-                         scaled_img = pygame.transform.scale(img, (aw, 280))
-                         self.screen.blit(scaled_img, (ai_x + 15, ay + 80))
             else:
                 # Show Choice (Normal or Fatal)
                 choice_text = event['options'][choice_idx]['text']
-                reason = self.game.simultaneous_data['ai_reason']
+                reason = sim['ai_reason']
                 
                 draw_text(self.screen, "AI CHOSE:", self.font_small, COLOR_ACCENT, ax, status_y)
                 draw_multiline_text(self.screen, choice_text, self.font_title, COLOR_TEXT, ax, status_y + 25, aw)
@@ -1371,34 +1599,30 @@ class MarsColonyGame:
         draw_text(self.screen, "HUMAN PLAYER", self.font_title, COLOR_ACCENT, px + pw // 2, py, center=True)
         
         # Stats
-        p_stats = self.game.stats
-        draw_text(self.screen, f"Population: {p_stats['pop']} | Quality of Life: {p_stats['qol']}", self.font_normal, COLOR_TEXT, px + pw // 2, py + 40, center=True)
-
-        # Image
-        if event['id'] in self.event_images:
-            img = self.event_images[event['id']]
-            scaled_img = pygame.transform.scale(img, (pw, 280))
+        p_stats = game.stats
+        draw_text(self.screen, f"Population: {p_stats.pop} | Quality of Life: {p_stats.qol}", self.font_normal, COLOR_TEXT, px + pw // 2, py + 40, center=True)
+
+        # Image, or the player's elimination image once they are out
+        scaled_img = None
+        if sim['ai_choice'] is not None and game.player_game_over and game.player_elimination_image:
+            # Scale to fit panel width (approx 440)
+            scaled_img = self.get_image(game.player_elimination_image, (pw, 280))
+        if scaled_img is None and event['id'] in self.event_images:
+            scaled_img = self.get_event_image(event['id'], (pw, 280))
+        if scaled_img:
             self.screen.blit(scaled_img, (player_x + 15, py + 80))
 
         # Controls
         menu_y = py + 380
         
-        if self.game.simultaneous_data['ai_choice'] is None:
+        if sim['ai_choice'] is None:
              draw_text(self.screen, "WAITING FOR AI...", self.font_normal, COLOR_ACCENT, px + pw//2, menu_y, center=True)
-             self.menu_options = []
-        elif self.game.player_game_over:
+             self.menu_options = ()
+        elif game.player_game_over:
              draw_text(self.screen, "ELIMINATED", self.font_title, COLOR_TEXT, px + pw//2, menu_y, center=True)
-             
-             # Draw elimination image if available
-             if self.game.player_elimination_image:
-                 img = self.load_and_scale_image(self.game.player_elimination_image)
-                 if img:
-                     # Scale to fit panel width (approx 440)
-                     scaled_img = pygame.transform.scale(img, (pw, 280))
-                     self.screen.blit(scaled_img, (player_x + 15, py + 80))
-             
+
              # Continue button
-             self.menu_options = ["Continue Watching"]
+             self.menu_options = ("Continue Watching",)
              draw_menu_options(
                 self.screen,
                 self.menu_options,
@@ -1411,7 +1635,7 @@ class MarsColonyGame:
              self._draw_nav_hint((px, py, pw, ph))
         else:
              # Show Options
-             self.menu_options = [opt['text'] for opt in event['options']]
+             self.menu_options = self.option_menus[event['id']]
              menu_height = draw_menu_options(
                 self.screen,
                 self.menu_options,
@@ -1441,7 +1665,9 @@ class MarsColonyGame:
 
     def render_simultaneous_result(self):
         """Render results for simultaneous turn"""
-        if not self.game.simultaneous_data['player_outcome']:
+        game = self.game
+        sim = game.simultaneous_data
+        if not sim['player_outcome']:
             return
 
         # Reuse similar layout
@@ -1459,21 +1685,20 @@ class MarsColonyGame:
         
         # --- AI Result ---
         ax, ay, aw, ah = draw_text_box(self.screen, ai_x, y, col_w, col_h)
-        ai_out = self.game.simultaneous_data['ai_outcome']
+        ai_out = sim['ai_outcome']
         
         draw_text(self.screen, "AI RESULT", self.font_title, COLOR_ACCENT, ax + aw // 2, ay, center=True)
         
-        if self.game.ai_game_over:
+        if game.ai_game_over:
             # Show Eliminated View
             draw_text(self.screen, "ELIMINATED", self.font_title, COLOR_TEXT, ax + aw//2, ay + 60, center=True)
             
             current_y_ai = ay + 110 # Starting Y after "ELIMINATED" title
             ai_image_h = 0
 
-            if self.game.ai_elimination_image:
-                 img = self.load_and_scale_image(self.game.ai_elimination_image)
-                 if img:
-                     scaled_img = pygame.transform.scale(img, (aw, 280)) # Scale for panel width
+            if game.ai_elimination_image:
+                 scaled_img = self.get_image(game.ai_elimination_image, (aw, 280)) # Scale for panel width
+                 if scaled_img:
                      # Center image horizontally in its panel
                      image_x_offset_ai = (aw - scaled_img.get_width()) // 2 + ax
                      self.screen.blit(scaled_img, (image_x_offset_ai, current_y_ai))
@@ -1491,29 +1716,27 @@ class MarsColonyGame:
             draw_multiline_text(self.screen, ai_out['message'], self.font_normal, COLOR_TEXT, ax, ay + 120, aw)
             
             # Stats Delta
-            old = ai_out['old_stats']
-            new = ai_out['new_stats']
-            draw_text(self.screen, f"Population: {old['pop']} -> {new['pop']}", self.font_normal, COLOR_TEXT, ax, ay + 300)
-            draw_text(self.screen, f"Quality of Life: {old['qol']} -> {new['qol']}", self.font_normal, COLOR_TEXT, ax, ay + 340)
+            pop_text, qol_text = self._delta_texts(ai_out)
+            draw_text(self.screen, pop_text, self.font_normal, COLOR_TEXT, ax, ay + 300)
+            draw_text(self.screen, qol_text, self.font_normal, COLOR_TEXT, ax, ay + 340)
 
 
         # --- Player Result ---
         px, py, pw, ph = draw_text_box(self.screen, player_x, y, col_w, col_h)
-        p_out = self.game.simultaneous_data['player_outcome']
+        p_out = sim['player_outcome']
         
         draw_text(self.screen, "YOUR RESULT", self.font_title, COLOR_ACCENT, px + pw // 2, py, center=True)
         
-        if self.game.player_game_over:
+        if game.player_game_over:
             # Show Eliminated View
             draw_text(self.screen, "ELIMINATED", self.font_title, COLOR_TEXT, px + pw//2, py + 60, center=True)
             
             current_y_player = py + 110 # Starting Y after "ELIMINATED" title
             player_image_h = 0
 
-            if self.game.player_elimination_image:
-                 img = self.load_and_scale_image(self.game.player_elimination_image)
-                 if img:
-                     scaled_img = pygame.transform.scale(img, (pw, 280))
+            if game.player_elimination_image:
+                 scaled_img = self.get_image(game.player_elimination_image, (pw, 280))
+                 if scaled_img:
                      # Center image horizontally in its panel
                      image_x_offset_player = (pw - scaled_img.get_width()) // 2 + px
                      self.screen.blit(scaled_img, (image_x_offset_player, current_y_player))
@@ -1530,10 +1753,9 @@ class MarsColonyGame:
             draw_multiline_text(self.screen, p_out['message'], self.font_normal, COLOR_TEXT, px, py + 120, pw)
 
             # Stats Delta
-            old = p_out['old_stats']
-            new = p_out['new_stats']
-            draw_text(self.screen, f"Population: {old['pop']} -> {new['pop']}", self.font_normal, COLOR_TEXT, px, py + 300)
-            draw_text(self.screen, f"Quality of Life: {old['qol']} -> {new['qol']}", self.font_normal, COLOR_TEXT, px, py + 340)
+            pop_text, qol_text = self._delta_texts(p_out)
+            draw_text(self.screen, pop_text, self.font_normal, COLOR_TEXT, px, py + 300)
+            draw_text(self.screen, qol_text, self.font_normal, COLOR_TEXT, px, py + 340)
 
         # --- Center Control ---
         cx, cy, cw, ch = draw_text_box(self.screen, center_x, y, center_w, col_h)
@@ -1541,7 +1763,7 @@ class MarsColonyGame:
         draw_text(self.screen, "ROUND COMPLETE", self.font_title, COLOR_ACCENT, cx, cy, center=True)
         
         # Next Button
-        self.menu_options = ["Next Event"]
+        self.menu_options = ("Next Event",)
         draw_menu_options(
             self.screen,
             self.menu_options,
@@ -1556,11 +1778,25 @@ class MarsColonyGame:
     def run(self):
         """Main game loop"""
         running = True
+        events = None
 
         while running:
-            running = self.handle_events()
+            running = self.handle_events(events)
+            self.update()
+            idle = not self._screen_dirty
             self.render()
-            self.clock.tick(FPS)
+
+            if idle:
+                # Nothing changed this tick and every screen is static: sleep
+                # until input or AI_DONE_EVENT arrives instead of polling
+                first = pygame.event.wait(IDLE_WAIT_MS)
+                events = pygame.event.get()
+                if first.type != pygame.NOEVENT:
+                    events.insert(0, first)
+                self.clock.tick()
+            else:
+                events = None
+                self.clock.tick(FPS)
 
         pygame.quit()
         sys.exit()
@@ -1583,9 +1819,7 @@ class MarsColonyGame:
         self.game.selected_option = option_index
 
         # Process outcome
-        option = event['options'][option_index]
-        self.game.old_stats = self.game.stats.copy()
-        self.game.process_outcome(option)
+        self.game.process_outcome(option_index)
 
         # Record decision
         self.game.record_ai_decision(option_index, self.game.outcome_data['success'], reason=reason)
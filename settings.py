@@ -2,7 +2,7 @@
 Game settings and constants for Mars Colony Manager
 Retro GameBoy aesthetic configuration
 """
-from enum import Enum
+from enum import IntEnum
 
 # Screen settings (Internal Resolution)
 SCREEN_WIDTH = 1740
@@ -13,6 +13,18 @@ INITIAL_WINDOW_WIDTH = int(SCREEN_WIDTH * 0.75)
 INITIAL_WINDOW_HEIGHT = int(SCREEN_HEIGHT * 0.75)
 
 FPS = 60
+# Longest the main loop sleeps waiting for an event while nothing on screen
+# changes (render() also forces a redraw once a second)
+IDLE_WAIT_MS = 1000
+
+# Window scaling filter: nearest-neighbour suits the pixel-art look and is
+# much cheaper; set True to use bilinear smoothscale at fractional scales
+SMOOTH_SCALING = False
+
+# Two-pane layout on the virtual screen, as (x, y, width, height)
+LEFT_PANE = (20, 20, 890, 860)     # Event / result text
+IMAGE_PANE = (930, 20, 790, 500)   # Top-right picture
+MENU_PANE = (930, 540, 790, 340)   # Bottom-right menu
 
 # GameBoy retro colors (classic green palette)
 COLOR_BG = (15, 56, 15)           # Dark green background
@@ -27,8 +39,8 @@ FONT_NORMAL = 22
 FONT_SMALL = 17
 
 
-class GameState(Enum):
-    """Game state machine states"""
+class GameState(IntEnum):
+    """Game state machine states (ints, so dispatch dicts hash them cheaply)"""
     START_SCREEN = 1           # Title + "Press Any Key"
     MODE_SELECT = 2            # Choose AI vs Human mode
     AI_THINKING = 3            # "AI is thinking..." display
@@ -2,9 +2,83 @@
 UI Manager for retro-styled TUI rendering
 Pokemon-style text box interface
 """
+import weakref
+from collections import OrderedDict
+
 import pygame
 from settings import COLOR_TEXT, COLOR_ACCENT, COLOR_BG
 
+# Entries kept in each cache below. Stats lines and AI reasons change from
+# turn to turn, so the least recently used entries are dropped over a session.
+_CACHE_LIMIT = 512
+
+# Rendered text surfaces keyed by (font id, text, color). Fonts live for the
+# whole game, and most strings repeat every frame, so each is rasterized once.
+_text_cache = OrderedDict()
+
+# Wrapped lines keyed by (font id, text, max width), see wrap_text
+_wrap_cache = OrderedDict()
+
+# Whole wrapped text blocks keyed by (font id, text, color, max width), see
+# render_multiline_text
+_block_cache = OrderedDict()
+
+
+# Ids of fonts that have entries in the caches above
+_registered_fonts = set()
+
+
+def _font_key(font):
+    """
+    Return the cache key for font, arranging for its entries to be dropped
+    once it is freed so a later font reusing the same id never hits them
+    """
+    font_id = id(font)
+    if font_id not in _registered_fonts:
+        _registered_fonts.add(font_id)
+        weakref.finalize(font, _evict_font, font_id)
+    return font_id
+
+
+def _evict_font(font_id):
+    """Remove every cached entry rendered or measured with a freed font"""
+    _registered_fonts.discard(font_id)
+    for cache in (_text_cache, _wrap_cache, _block_cache):
+        for key in [key for key in cache if key[0] == font_id]:
+            del cache[key]
+
+
+def _cache_store(cache, key, value):
+    """Insert into an LRU cache, evicting the oldest entry when it is full"""
+    cache[key] = value
+    if len(cache) > _CACHE_LIMIT:
+        cache.popitem(last=False)
+
+
+def render_text(font, text, color):
+    """
+    Return the rendered surface for text, rasterizing it only the first time
+
+    Args:
+        font: pygame font object
+        text: string to render
+        color: RGB tuple
+
+    Returns:
+        pygame.Surface with the antialiased text
+    """
+    key = (_font_key(font), text, color)
+    text_surface = _text_cache.get(key)
+    if text_surface is None:
+        text_surface = font.render(text, True, color)
+        if pygame.display.get_surface() is not None:
+            # Match the display's pixel format so blits take the fast path
+            text_surface = text_surface.convert_alpha()
+        _cache_store(_text_cache, key, text_surface)
+    else:
+        _text_cache.move_to_end(key)
+    return text_surface
+
 
 def draw_text(surface, text, font, color, x, y, center=False):
     """
@@ -18,7 +92,7 @@ def draw_text(surface, text, font, color, x, y, center=False):
         x, y: position coordinates
         center: if True, center the text at (x, y)
     """
-    text_surface = font.render(text, True, color)
+    text_surface = render_text(font, text, color)
     text_rect = text_surface.get_rect()
 
     if center:
@@ -30,21 +104,27 @@ def draw_text(surface, text, font, color, x, y, center=False):
     return text_rect
 
 
-def draw_multiline_text(surface, text, font, color, x, y, max_width):
+def wrap_text(text, font, max_width):
     """
-    Draw text with word wrapping to fit within max_width
+    Split text into lines that fit within max_width, caching the result
+
+    Event titles, descriptions and options stay the same for as long as an
+    event is displayed, so each is wrapped once rather than every frame.
 
     Args:
-        surface: pygame surface to draw on
-        text: string to render (will be wrapped)
+        text: string to wrap
         font: pygame font object
-        color: RGB tuple
-        x, y: top-left position
         max_width: maximum width in pixels before wrapping
 
     Returns:
-        Total height of rendered text block
+        tuple of line strings
     """
+    key = (_font_key(font), text, max_width)
+    lines = _wrap_cache.get(key)
+    if lines is not None:
+        _wrap_cache.move_to_end(key)
+        return lines
+
     words = text.split(' ')
     lines = []
     current_line = []
@@ -52,9 +132,10 @@ def draw_multiline_text(surface, text, font, color, x, y, max_width):
     for word in words:
         current_line.append(word)
         test_line = ' '.join(current_line)
-        test_surface = font.render(test_line, True, color)
+        # pygame.font.Font.size returns (width, height) without rendering
+        w, h = font.size(test_line)
 
-        if test_surface.get_width() > max_width:
+        if w > max_width:
             if len(current_line) == 1:
                 # Single word is too long, just use it
                 lines.append(test_line)
@@ -69,51 +150,84 @@ def draw_multiline_text(surface, text, font, color, x, y, max_width):
     if current_line:
         lines.append(' '.join(current_line))
 
-    # Draw all lines
+    lines = tuple(lines)
+    _cache_store(_wrap_cache, key, lines)
+    return lines
+
+
+def render_multiline_text(text, font, color, max_width):
+    """
+    Return one surface holding text wrapped to max_width, built only once
+
+    Event descriptions and AI reasons are drawn every frame while their state
+    lasts; baking the lines into a single surface turns a dozen blits into one.
+
+    Args:
+        text: string to render (will be wrapped)
+        font: pygame font object
+        color: RGB tuple
+        max_width: maximum width in pixels before wrapping
+
+    Returns:
+        pygame.Surface with the wrapped, antialiased text
+    """
+    key = (_font_key(font), text, color, max_width)
+    block = _block_cache.get(key)
+    if block is not None:
+        _block_cache.move_to_end(key)
+        return block
+
+    lines = wrap_text(text, font, max_width)
     line_height = font.get_height()
-    for i, line in enumerate(lines):
-        draw_text(surface, line, font, color, x, y + i * line_height)
+    line_surfaces = [font.render(line, True, color) for line in lines]
+    width = max((line.get_width() for line in line_surfaces), default=0)
+    # Rendered lines can be a little taller than the line spacing
+    height = max((i * line_height + line.get_height() for i, line in enumerate(line_surfaces)), default=0)
 
-    return len(lines) * line_height
+    block = pygame.Surface((width, height), pygame.SRCALPHA)
+    for i, line_surface in enumerate(line_surfaces):
+        # Copy the lines in as-is (max of the channels) rather than blending
+        # them onto the transparent block
+        block.blit(line_surface, (0, i * line_height), special_flags=pygame.BLEND_RGBA_MAX)
+    if pygame.display.get_surface() is not None:
+        block = block.convert_alpha()
 
+    _cache_store(_block_cache, key, block)
+    return block
 
-def measure_multiline_text(text, font, max_width):
+
+def draw_multiline_text(surface, text, font, color, x, y, max_width):
     """
-    Calculate height of text with word wrapping without drawing
+    Draw text with word wrapping to fit within max_width
 
     Args:
-        text: string to measure
+        surface: pygame surface to draw on
+        text: string to render (will be wrapped)
         font: pygame font object
+        color: RGB tuple
+        x, y: top-left position
         max_width: maximum width in pixels before wrapping
 
     Returns:
-        int: Total height of text block
+        Total height of rendered text block
     """
-    words = text.split(' ')
-    lines = []
-    current_line = []
+    surface.blit(render_multiline_text(text, font, color, max_width), (x, y))
+    return len(wrap_text(text, font, max_width)) * font.get_height()
 
-    for word in words:
-        current_line.append(word)
-        test_line = ' '.join(current_line)
-        # We need a dummy surface to measure size, but font.size() works without one usually
-        # pygame.font.Font.size returns (width, height)
-        w, h = font.size(test_line)
 
-        if w > max_width:
-            if len(current_line) == 1:
-                lines.append(test_line)
-                current_line = []
-            else:
-                current_line.pop()
-                lines.append(' '.join(current_line))
-                current_line = [word]
+def measure_multiline_text(text, font, max_width):
+    """
+    Calculate height of text with word wrapping without drawing
 
-    if current_line:
-        lines.append(' '.join(current_line))
+    Args:
+        text: string to measure
+        font: pygame font object
+        max_width: maximum width in pixels before wrapping
 
-    line_height = font.get_height()
-    return len(lines) * line_height
+    Returns:
+        int: Total height of text block
+    """
+    return len(wrap_text(text, font, max_width)) * font.get_height()
 
 
 def draw_text_box(surface, x, y, width, height, border_width=3):
@@ -135,8 +249,21 @@ def draw_text_box(surface, x, y, width, height, border_width=3):
     # Draw border
     pygame.draw.rect(surface, COLOR_TEXT, (x, y, width, height), border_width)
 
-    # Return inner content area (with padding)
-    padding = 15
+    return text_box_inner(x, y, width, height)
+
+
+def text_box_inner(x, y, width, height, padding=15):
+    """
+    Return the content area of a text box without drawing anything
+
+    Args:
+        x, y: top-left position of the box
+        width, height: box dimensions
+        padding: space between the box edge and its content
+
+    Returns:
+        Inner rect (x, y, width, height) for content area
+    """
     return (x + padding, y + padding, width - 2*padding, height - 2*padding)
 
 
@@ -156,8 +283,18 @@ def draw_menu_options(surface, options, selected_index, font, x, y, max_width, l
     Returns:
         Total height used.
     """
+    if len(options) == 1:
+        # Most screens offer a single "Next"/"Continue" item: draw it straight
+        # away instead of building a one-entry blit batch
+        cursor, color = ("> ", COLOR_ACCENT) if selected_index == 0 else ("  ", COLOR_TEXT)
+        full_text = cursor + options[0]
+        surface.blit(render_multiline_text(full_text, font, color, max_width), (x, y))
+        return len(wrap_text(full_text, font, max_width)) * font.get_height() + line_spacing
+
     current_y = y
-    
+    # Collect every option block first and blit them in one call
+    blit_sequence = []
+
     for i, option_text in enumerate(options):
         # Draw cursor for selected option
         if i == selected_index:
@@ -170,20 +307,13 @@ def draw_menu_options(surface, options, selected_index, font, x, y, max_width, l
         # Combine cursor and text
         full_text = cursor + option_text
 
-        # Draw as multiline text within the given max_width
-        # Note: draw_multiline_text internally handles X for each line, so it's always left-aligned
-        text_block_height = draw_multiline_text(
-            surface,
-            full_text,
-            font,
-            color,
-            x,
-            current_y,
-            max_width
-        )
-        
+        # Render as multiline text within the given max_width, always left-aligned
+        blit_sequence.append((render_multiline_text(full_text, font, color, max_width), (x, current_y)))
+        text_block_height = len(wrap_text(full_text, font, max_width)) * font.get_height()
+
         current_y += text_block_height + line_spacing # Add spacing between wrapped options
 
+    surface.blits(blit_sequence, doreturn=False)
     return current_y - y # Total height used
 
 def draw_text_right(surface, text, font, color, x_right, y):
@@ -197,7 +327,7 @@ def draw_text_right(surface, text, font, color, x_right, y):
         color: RGB tuple
         x_right, y: position coordinates (x_right is the rightmost point)
     """
-    text_surface = font.render(text, True, color)
+    text_surface = render_text(font, text, color)
     text_rect = text_surface.get_rect()
     text_rect.topright = (x_right, y)
     surface.blit(text_surface, text_rect)